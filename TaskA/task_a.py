@@ -10,7 +10,7 @@
 
 """
 Program that reads reservation details from a file
-and prints them to the console:
+and prints a receipt for every reservation to the console:
 
 Reservation number: 123
 Booker: Anna Virtanen
@@ -24,56 +24,44 @@ Location: Meeting Room A
 Phone: 0401234567
 Email: anna.virtanen@example.com
 """
-from datetime import datetime
+import sys
+
+import _bootstrap  # noqa: F401
+from taskcore.receipts import decode_reservation, receipt_fields, render_receipts
+
+# Precompiled receipt layout (the line itself, then the receipt), filled with str.format
+RECEIPT_TEMPLATE = (
+    "{}\n"
+    "Reservation number: {}\n"
+    "Booker: {}\n"
+    "Date: {:02d}.{:02d}.{}\n"
+    "Start time: {:02d}.{:02d}\n"
+    "Number of hours: {}\n"
+    "Hourly price: {} €\n"
+    "Total price: {} €\n"
+    "Paid: {}\n"
+    "Location: {}\n"
+    "Phone: {}\n"
+    "Email: {}\n"
+).format
+
+
+def render_receipt(reservation: str) -> str:
+    # Split the line only once and decode it into a typed Reservation record
+    return RECEIPT_TEMPLATE(reservation, *receipt_fields(decode_reservation(reservation)))
 
 
 def main():
     # Define the file name directly in the code
     reservations = "reservations.txt"
 
-    # Open the file and read its contents
+    # Open the file and render a receipt for every reservation in it
     with open(reservations, "r", encoding="utf-8") as f:
-        reservation = f.read().strip()
-
-    # Print the reservation to the console
-    print(reservation)
+        output = render_receipts(f, render_receipt)
 
-    # Try these
-    #print(reservation.split('|'))
-    reservationId = int(reservation.split('|')[0])
-    print(f"Reservation number: {reservationId}")
-    
-    booker = reservation.split('|')[1]
-    print(f"Booker: {booker}")
-    
-    day = datetime.strptime(reservation.split('|')[2], "%Y-%m-%d").date()
-    finish_day = day.strftime("%d.%m.%Y")
-    print(f"Date: {finish_day}")
-    
-    time = datetime.strptime(reservation.split('|')[3], "%H:%M").time()
-    finish_time = time.strftime("%H.%M")
-    print(f"Start time: {finish_time}")
-    
-    number_of_hours = int(reservation.split('|')[4])
-    print(f"Number of hours: {number_of_hours}")
-    
-    hourly_price = float(reservation.split('|')[5])
-    print(f"Hourly price: {hourly_price:.2f}".replace('.', ',') + " €")
-    
-    total_price = number_of_hours*hourly_price
-    print(f"Total price: {total_price:.2f}".replace('.', ',') + " €")
-    
-    paid = bool(reservation.split('|')[6])
-    print(f"Paid: {'Yes' if paid else 'No'}")
-    
-    resource = reservation.split('|')[7]
-    print(f"Location: {resource}")
-    
-    phone = reservation.split('|')[8]
-    print(f"Phone: {phone}")
-    
-    email = reservation.split('|')[9]
-    print(f"Email: {email}")
+    # Print all receipts to the console with one write
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
 
 
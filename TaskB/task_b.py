@@ -10,7 +10,7 @@
 
 """
 A program that reads reservation data from a file
-and prints them to the console using functions:
+and prints a receipt for every reservation to the console:
 
 Reservation number: 123
 Booker: Anna Virtanen
@@ -24,90 +24,49 @@ Venue: Meeting Room A
 Phone: 0401234567
 Email: anna.virtanen@example.com
 
+Each line is split once and decoded into a Reservation record (shared
+with TaskA in taskcore.receipts), and all receipts are rendered through
+one precompiled template and written to the console with a single write.
 """
-from datetime import datetime
+import sys
 
-def print_reservation_number(reservation: list) -> None: 
-    print(f"Reservation number: {reservation[0]}")
+import _bootstrap  # noqa: F401
+from taskcore.receipts import decode_reservation, receipt_fields, render_receipts
 
-def print_booker(reservation: list) -> None:
-    """
-    Prints the reservation number
-
-    Parameters:
-     reservation (lst): reservation -> columns separated by |
-    """
-    booker = reservation[1]
-    print(f"Booker: {booker}")
-    
-
-def print_date(reservation: list) -> None:
-    date_str = reservation[2]
-    day = datetime.strptime(date_str, "%Y-%m-%d").date()
-    print(f"Date: {day.strftime('%d.%m.%Y')}")
-
-def print_start_time(reservation: list) -> None:
-    time_str = reservation[3]
-    t = datetime.strptime(time_str, "%H:%M").time()
-    print(f"Start time: {t.strftime('%H.%M')}")
-
-def print_hours(reservation: list) -> None:
-    print(f"Number of hours: {reservation[4]}")
+RECEIPT_TEMPLATE = (
+    "Reservation number: {}\n"
+    "Booker: {}\n"
+    "Date: {:02d}.{:02d}.{}\n"
+    "Start time: {:02d}.{:02d}\n"
+    "Number of hours: {}\n"
+    "Hourly rate: {} €\n"
+    "Total price: {} €\n"
+    "Paid: {}\n"
+    "Venue: {}\n"
+    "Phone: {}\n"
+    "Email: {}\n"
+).format
 
-def print_hourly_rate(reservation: list) -> None:
-    rate = float(reservation[5])
-    print(f"Hourly rate: {rate:.2f}".replace('.', ',') + " €")
 
-def print_total_price(reservation: list) -> None:
-    hours = int(reservation[4])
-    rate = float(reservation[5])
-    total = hours * rate
-    print(f"Total price: {total:.2f}".replace('.', ',') + " €")
-
-def print_paid(reservation: list) -> None:
-    paid = reservation[6] == "True"
-    print(f"Paid: {'Yes' if paid else 'No'}")
-
-def print_venue(reservation: list) -> None:
-    print(f"Venue: {reservation[7]}")
-
-def print_phone(reservation: list) -> None:
-    print(f"Phone: {reservation[8]}")
-
-def print_email(reservation: list) -> None:
-    print(f"Email: {reservation[9]}")
+def render_receipt(line: str) -> str:
+    """Returns the printable receipt of one reservation line"""
+    return RECEIPT_TEMPLATE(*receipt_fields(decode_reservation(line)))
 
 
 def main():
     """
-    Reads reservation data from a file and
-    prints them to the console using functions
+    Reads all reservations from a file and
+    prints a receipt for each of them
     """
     # Define the file name directly in the code
     reservations = "reservations.txt"
 
-    # Open the file, read it, and split the contents
     with open(reservations, "r", encoding="utf-8") as f:
-        reservation = f.read().strip()
-        reservation = reservation.split('|')
-
-    # Implement the remaining parts following
-    # the function print_booker(reservation)
-    
-    # The functions to be created should perform type conversions
-    # and print according to the sample output
+        output = render_receipts(f, render_receipt)
 
-    print_reservation_number(reservation)
-    print_booker(reservation)
-    print_date(reservation)
-    print_start_time(reservation)
-    print_hours(reservation)
-    print_hourly_rate(reservation)
-    print_total_price(reservation)
-    print_paid(reservation)
-    print_venue(reservation)
-    print_phone(reservation)
-    print_email(reservation)
+    # one buffered write for the whole batch
+    sys.stdout.write(output)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
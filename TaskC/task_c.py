@@ -20,7 +20,14 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+import sys
+
+import _bootstrap  # noqa: F401
+from taskcore.appender import read_lines
+from taskcore.report_format import (ASCII_STATUS_LINE, CONFIRMED_LINE, LONG_LINE, format_date, format_time,
+                                   print_section)
+from taskcore.reservations import parse_date, parse_datetime, parse_time
+from taskcore.symbols import SymbolTable, decoder
 
 HEADERS = [
     "reservationId",
@@ -36,13 +43,17 @@ HEADERS = [
     "createdAt",
 ]
 
+# name, email, phone, reservedResource: dictionary encoded with --encode
+TEXT_FIELDS = (1, 2, 3, 9)
+
 
-def convert_reservation_data(reservation: list) -> list:
+def convert_reservation_data(reservation: list, symbols: SymbolTable | None = None) -> list:
     """
     Convert data types to meet program requirements
 
     Parameters:
      reservation (list): Unconverted reservation -> 11 columns
+     symbols (SymbolTable): If given, the text fields are stored as its int codes
 
     Returns:
      converted (list): Converted data types
@@ -57,15 +68,9 @@ def convert_reservation_data(reservation: list) -> list:
     
     converted.append(reservation[3])  # phone (str)
     
-    reservation_date = datetime.strptime(reservation[4], "%Y-%m-%d").date()
-    converted.append(reservation_date)  # reservationDate (date)
+    converted.append(parse_date(reservation[4]))  # reservationDate (date)
     
-    time_str = reservation[5].strip() 
-    if len(time_str) == 5: # HH:MM 
-        reservation_time = datetime.strptime(time_str, "%H:%M").time() 
-    else: # HH:MM:SS 
-         reservation_time = datetime.strptime(time_str, "%H:%M:%S").time() 
-    converted.append(reservation_time) # reservationTime (time)
+    converted.append(parse_time(reservation[5]))  # reservationTime (time), HH:MM or HH:MM:SS
          
     converted.append(int(reservation[6]))  # durationHours (int)
     
@@ -75,65 +80,72 @@ def convert_reservation_data(reservation: list) -> list:
     
     converted.append(reservation[9])  # reservedResource (str)
     
-    created_at = datetime.strptime(reservation[10].strip(), "%Y-%m-%d %H:%M:%S") 
-    converted.append(created_at)# createdAt (datetime)
-    
+    converted.append(parse_datetime(reservation[10]))  # createdAt (datetime)
+
+    if symbols is not None:
+        for i in TEXT_FIELDS:
+            converted[i] = symbols.encode(converted[i])
     return converted
 
 
-def fetch_reservations(reservation_file: str) -> list:
+def fetch_reservations(reservation_file: str, symbols: SymbolTable | None = None) -> list:
     """
     Reads reservations from a file and returns the reservations converted
     You don't need to modify this function!
 
     Parameters:
      reservation_file (str): Name of the file containing the reservations
+     symbols (SymbolTable): If given, the text fields are dictionary encoded into it
 
     Returns:
      reservations (list): Read and converted reservations
     """
     reservations = []
-    with open(reservation_file, "r", encoding="utf-8") as f:
-        for line in f:
-            fields = line.split("|")
-            reservations.append(convert_reservation_data(fields))
+    for line in read_lines(reservation_file):
+        fields = line.split("|")
+        reservations.append(convert_reservation_data(fields, symbols))
     return reservations
 
 
-def confirmed_reservations(reservations: list[list]) -> None:
-    for r in reservations:
-        if r[8]:  # confirmed
-            date_str = r[4].strftime("%d.%m.%Y")
-            time_str = r[5].strftime("%H.%M")
-            print(f"- {r[1]}, {r[9]}, {date_str} at {time_str}")
+def confirmed_reservations(reservations: list[list], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        CONFIRMED_LINE(text(r[1]), text(r[9]), format_date(r[4]), format_time(r[5]))
+        for r in reservations
+        if r[8]  # confirmed
+    ])
 
 
-def long_reservations(reservations: list[list]) -> None:
+def long_reservations(reservations: list[list], symbols: SymbolTable | None = None) -> None:
     """
     Print long reservations
 
     Parameters:
      reservations (list): Reservations
+     symbols (SymbolTable): Decodes the text fields of encoded reservations
     """
-    for r in reservations:
-        if r[6] >= 3:
-            date_str = r[4].strftime("%d.%m.%Y")
-            time_str = r[5].strftime("%H.%M")
-            print(f"- {r[1]}, {date_str} at {time_str}, duration {r[6]} h, {r[9]}")
+    text = decoder(symbols)
+    print_section([
+        LONG_LINE(text(r[1]), format_date(r[4]), format_time(r[5]), r[6], text(r[9]))
+        for r in reservations
+        if r[6] >= 3
+    ])
 
 
 
-def confirmation_statuses(reservations: list[list]) -> None:
+def confirmation_statuses(reservations: list[list], symbols: SymbolTable | None = None) -> None:
     """
     Print confirmation statuses
 
     Parameters:
      reservations (list): Reservations
+     symbols (SymbolTable): Decodes the text fields of encoded reservations
     """
-    for r in reservations: 
-        print(r[1], "->", "Confirmed"
-              if r[8] 
-              else "NOT confirmed")
+    text = decoder(symbols)
+    print_section([
+        ASCII_STATUS_LINE(text(r[1]), "Confirmed" if r[8] else "NOT confirmed")
+        for r in reservations
+    ])
 
 
 def confirmation_summary(reservations: list[list]) -> None:
@@ -160,8 +172,9 @@ def total_revenue(reservations: list[list]) -> None:
     print("Total revenue:", total)
 
 
-def main(): 
-    reservations = fetch_reservations("reservations.txt")
+def main(encode: bool = False):
+    symbols = SymbolTable() if encode else None
+    reservations = fetch_reservations("reservations.txt", symbols)
 
     """
     Prints reservation information according to requirements
@@ -185,15 +198,15 @@ def main():
     # the predefined functions and the necessary print statements.
 
     print("1) Confirmed Reservations") 
-    confirmed_reservations(reservations)
+    confirmed_reservations(reservations, symbols)
     print()
     
     print("2) Long Reservations")
-    long_reservations(reservations)
+    long_reservations(reservations, symbols)
     print()
     
     print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
+    confirmation_statuses(reservations, symbols)
     print()
     
     print("4) Confirmation Summary")
@@ -206,4 +219,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main("--encode" in sys.argv[1:])
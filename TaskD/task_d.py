@@ -9,8 +9,10 @@
 # Modified by nnn according to given task
 
 
-from datetime import datetime, date
-import csv
+from datetime import date
+
+import _bootstrap  # noqa: F401
+from taskcore.phases import read_data
 
 DAYS = [
     "Monday",
@@ -22,55 +24,6 @@ DAYS = [
     "Sunday"
 ]
 
-def convert_data(line: list) -> list:
-    """
-    Convert data types to meet program requirements.
-
-    Parameters:
-        line (list): Unconverted line -> 7 columns
-
-    Returns:
-        converted (list): Converted data types
-    """
-    converted = []
-
-    # 1. timestamp
-    converted.append(datetime.fromisoformat(line[0]))
-
-    # 2–7. six numeric values (Wh)
-    converted.append(int(line[1]))  # consumption phase 1
-    converted.append(int(line[2]))  # consumption phase 2
-    converted.append(int(line[3]))  # consumption phase 3
-    converted.append(int(line[4]))  # production phase 1
-    converted.append(int(line[5]))  # production phase 2
-    converted.append(int(line[6]))  # production phase 3
-
-    return converted
-
-
-
-def read_data(filename: str) -> list:
-    """
-    Reads the CSV file and returns the rows in a suitable structure.
-
-    Parameters:
-        filename (str): Name of the file containing the electricity data
-
-    Returns:
-        list: Parsed consumption and production rows
-    """
-    consumption_and_production = []
-
-    with open(filename, "r", encoding="utf-8") as f:
-        next(f)
-        for line in f:
-            line = line.strip()
-            fields = line.split(";")
-            consumption_and_production.append(convert_data(fields))
-
-    return consumption_and_production
-
-
 def day_information(day: date, database: list) -> str:
     """
     Create printable string for a given day.
@@ -0,0 +1,163 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# Modified by nnn according to given task
+
+"""
+Single-pass anomaly detection on the per-phase hourly consumption
+(the week CSVs of TaskD/TaskE).
+
+Rows are streamed line by line and every phase keeps only a few numbers:
+a Welford running mean/variance and an exponentially weighted moving
+average (EWMA).  Flagged hours:
+
+  spike      phase value far above its EWMA level (in standard deviations)
+  imbalance  (max - min) / total of the three phases far above its usual level
+  zero       all three consumption phases read 0
+  gap        one or more hours missing between consecutive rows
+
+Usage:
+  python anomaly.py week41.csv week42.csv week43.csv
+  python anomaly.py --merge gateway1.csv gateway2.csv   (unordered / overlapping files)
+"""
+
+import math
+import sys
+from datetime import datetime, timedelta
+
+import _bootstrap  # noqa: F401
+from task_e import convert_data
+from taskcore.phases import merged_rows
+
+SPIKE_SIGMAS = 4.0
+IMBALANCE_SIGMAS = 4.0
+EWMA_ALPHA = 0.1
+WARMUP_HOURS = 24
+HOUR = timedelta(hours=1)
+
+
+class Welford:
+    """Running mean and variance in constant memory."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
+class Ewma:
+    """Exponentially weighted moving average."""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self.value = None
+
+    def add(self, x: float) -> None:
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+
+
+class Anomaly:
+    def __init__(self, ts: datetime, kind: str, phase: int, value: float, expected: float):
+        self.ts = ts
+        self.kind = kind
+        self.phase = phase  # 1-3, 0 = all phases
+        self.value = value
+        self.expected = expected
+
+    def __str__(self) -> str:
+        f = lambda x: f"{x:.2f}".replace(".", ",")
+        phase = f"v{self.phase}" if self.phase else "--"
+        when = self.ts.strftime("%d.%m.%Y %H.%M")
+        if self.kind == "gap":
+            return f"{when}  {self.kind:<10}{phase}  {int(self.value)} h missing"
+        return f"{when}  {self.kind:<10}{phase}  {f(self.value)} (expected {f(self.expected)})"
+
+
+class PhaseDetector:
+    """Streaming detector for one meter; feed rows from convert_data in time order."""
+
+    def __init__(self):
+        self.stats = [Welford() for _ in range(3)]
+        self.levels = [Ewma() for _ in range(3)]
+        self.imbalance = Welford()
+        self.previous = None
+
+    def update(self, row: list) -> list:
+        """Checks one hourly row and returns the anomalies found in it."""
+        ts = row[0]
+        found = []
+        if self.previous is not None and ts - self.previous > HOUR:
+            found.append(Anomaly(self.previous + HOUR, "gap", 0, (ts - self.previous) / HOUR - 1, 0))
+        self.previous = ts
+
+        phases = [row[1] / 1000, row[2] / 1000, row[3] / 1000]
+        total = sum(phases)
+        if total == 0:
+            found.append(Anomaly(ts, "zero", 0, 0.0, self.levels[0].value or 0.0))
+
+        for i, x in enumerate(phases):
+            stats, level = self.stats[i], self.levels[i]
+            if stats.n >= WARMUP_HOURS and stats.std > 0:
+                if (x - level.value) / stats.std > SPIKE_SIGMAS:
+                    found.append(Anomaly(ts, "spike", i + 1, x, level.value))
+            stats.add(x)
+            level.add(x)
+
+        if total > 0:
+            ratio = (max(phases) - min(phases)) / total
+            im = self.imbalance
+            if im.n >= WARMUP_HOURS and im.std > 0 and (ratio - im.mean) / im.std > IMBALANCE_SIGMAS:
+                found.append(Anomaly(ts, "imbalance", 0, ratio, im.mean))
+            im.add(ratio)
+        return found
+
+
+def stream_rows(filenames):
+    """Yields converted rows of the files one line at a time."""
+    for filename in filenames:
+        with open(filename, "r", encoding="utf-8") as f:
+            next(f)
+            for line in f:
+                if line.strip():
+                    yield convert_data(line.strip().split(";"))
+
+
+def detect(rows, detector=None):
+    """Yields the anomalies of a stream of rows."""
+    detector = detector or PhaseDetector()
+    for row in rows:
+        yield from detector.update(row)
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    merge = "--merge" in args
+    filenames = [a for a in args if a != "--merge"] or ["week41.csv", "week42.csv", "week43.csv"]
+    # --merge sorts the rows of all files by time (external sort) and drops repeated hours
+    rows = merged_rows(filenames) if merge else stream_rows(filenames)
+    count = 0
+    for anomaly in detect(rows):
+        print(anomaly)
+        count += 1
+    print(f"{count} flagged hours")
+
+
+if __name__ == "__main__":
+    main()
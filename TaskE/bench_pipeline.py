@@ -0,0 +1,78 @@
+"""
+Benchmark of the summary pipeline on 52 weeks x N sites of generated
+hourly week CSVs: sequential, thread pool only, and thread pool reading
++ process pool computing.  All modes must render identical sections.
+
+Usage:
+  python bench_pipeline.py [SITES] [--processes N]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from pipeline import build_sections, build_summary, write_week_files
+
+HEADER = ("Aika;Kulutus vaihe 1 Wh;Kulutus vaihe 2 Wh;Kulutus vaihe 3 Wh;"
+          "Tuotanto vaihe 1 Wh;Tuotanto vaihe 2 Wh;Tuotanto vaihe 3 Wh")
+
+
+def write_site(directory: str, seed: int) -> list:
+    """52 week files for one site; returns its jobs."""
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    jobs = []
+    for week in range(1, 53):
+        start = datetime.combine(date.fromisocalendar(2025, week, 1), datetime.min.time())
+        lines = [HEADER]
+        for h in range(168):
+            ts = start + timedelta(hours=h)
+            values = [rng.randint(0, 2000) for _ in range(3)] + [rng.randint(0, 900) * (6 <= ts.hour <= 18) for _ in range(3)]
+            lines.append(ts.isoformat() + ";" + ";".join(map(str, values)))
+        path = os.path.join(directory, f"week{week:02d}.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        jobs.append((week, path))
+    return jobs
+
+
+def timed(label: str, jobs: list, **kwargs) -> list:
+    t0 = time.perf_counter()
+    results = build_sections(jobs, **kwargs)
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<26}{elapsed:8.3f} s {len(jobs) / elapsed:>10,.0f} weeks/s")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summary pipeline benchmark")
+    parser.add_argument("sites", nargs="?", type=int, default=8)
+    parser.add_argument("--processes", type=int, help="process pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = []
+        for site in range(args.sites):
+            jobs += write_site(os.path.join(tmp, f"site{site}"), site)
+        print(f"{args.sites} sites x 52 weeks = {len(jobs)} week files")
+
+        sequential = timed("sequential", jobs, threads=0)
+        threaded = timed("threads", jobs, threads=8, processes=0)
+        pooled = timed("threads + processes", jobs, threads=8, processes=args.processes)
+        assert sequential == threaded == pooled, "pipeline modes differ"
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(8) as pool:
+            for site in range(args.sites):
+                site_jobs = jobs[site * 52:(site + 1) * 52]
+                site_results = pooled[site * 52:(site + 1) * 52]
+                build_summary(site_results)
+                write_week_files(site_jobs, site_results, os.path.join(tmp, f"out{site}"), pool)
+        print(f"{'summaries + week files':<26}{time.perf_counter() - t0:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
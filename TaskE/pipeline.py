@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# Modified by nnn according to given task
+
+"""
+Concurrent summary pipeline: python task_e.py --parallel [options]
+
+  read     a thread pool reads the week files (I/O bound)
+  compute  a process pool parses the rows and renders each week's section
+           as soon as its file has been read
+  write    the sections are joined in week order and summary.txt is written
+           with one buffered write (atomically); with --split every week is
+           also written to its own file, in parallel
+
+By default (--processes 0) the sections are computed in the reading
+threads, which is faster than a process pool for a handful of small
+files; --processes N (or -1 for one per CPU) adds the process pool for
+many or large week files.
+
+Usage:
+  python pipeline.py [--threads N] [--processes N] [--split DIR]
+"""
+
+import argparse
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+import _bootstrap  # noqa: F401
+from task_e import SUMMARY_FILE, WEEKS, convert_data, format_totals, week_section
+from taskcore.tail import write_atomic
+
+Job = Tuple[int, str]  # (week number, CSV path)
+Result = Tuple[str, List[float]]  # (section, six phase totals in kWh)
+
+
+def read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def week_totals(rows: list) -> List[float]:
+    totals = [0, 0, 0, 0, 0, 0]
+    for row in rows:
+        for i in range(6):
+            totals[i] += row[i + 1] / 1000
+    return totals
+
+
+def render_week(week_number: int, text: str) -> Result:
+    """Parse one week file's text and render its section (runs in a worker process)."""
+    rows = [convert_data(line.strip().split(";")) for line in text.split("\n")[1:] if line.strip()]
+    return week_section(week_number, rows), week_totals(rows)
+
+
+def read_and_render(job: Job) -> Result:
+    return render_week(job[0], read_text(job[1]))
+
+
+def build_sections(jobs: List[Job], threads: int = 4, processes: Optional[int] = None) -> List[Result]:
+    """
+    Sections and totals of all jobs, in job order.
+    processes=None uses one process per CPU, 0 computes in the reading threads.
+    """
+    if threads <= 0:
+        return [read_and_render(job) for job in jobs]
+    with ThreadPoolExecutor(threads) as io_pool:
+        if processes == 0:
+            return list(io_pool.map(read_and_render, jobs))
+        with ProcessPoolExecutor(processes) as cpu_pool:
+            reads = {io_pool.submit(read_text, path): i for i, (_, path) in enumerate(jobs)}
+            renders = [None] * len(jobs)
+            for done in as_completed(reads):
+                i = reads[done]
+                renders[i] = cpu_pool.submit(render_week, jobs[i][0], done.result())
+            return [future.result() for future in renders]
+
+
+def build_summary(results: List[Result]) -> str:
+    """All sections in order followed by the combined totals."""
+    totals = [sum(result[1][i] for result in results) for i in range(6)]
+    return "".join(section for section, _ in results) + format_totals(totals[:3], totals[3:])
+
+
+def write_week_files(jobs: List[Job], results: List[Result], directory: str,
+                     pool: Optional[Executor] = None) -> List[str]:
+    """Write every section to DIR/week<N>.txt; returns the paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, f"week{week_number}.txt") for week_number, _ in jobs]
+    sections = [section for section, _ in results]
+    if pool is None:
+        for path, section in zip(paths, sections):
+            write_atomic(path, section)
+    else:
+        list(pool.map(write_atomic, paths, sections))
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build summary.txt with concurrent workers")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=0,
+                        help="worker processes for the compute stage; 0 (default) computes in the "
+                             "reading threads, -1 uses one process per CPU")
+    parser.add_argument("--split", metavar="DIR", help="also write one file per week into DIR")
+    parser.add_argument("-o", "--output", default=SUMMARY_FILE)
+    args = parser.parse_args(argv)
+
+    results = build_sections(WEEKS, args.threads, None if args.processes < 0 else args.processes)
+    write_atomic(args.output, build_summary(results))
+    if args.split:
+        with ThreadPoolExecutor(max(args.threads, 1)) as pool:
+            write_week_files(WEEKS, results, args.split, pool)
+
+
+if __name__ == "__main__":
+    main()
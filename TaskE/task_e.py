@@ -7,8 +7,14 @@
 # Modified by nnn according to given task
 
 
-from datetime import datetime, date
-import csv
+import sys
+from datetime import date
+
+import _bootstrap  # noqa: F401
+from taskcore.phases import convert_data, read_data
+
+WEEKS = [(41, "week41.csv"), (42, "week42.csv"), (43, "week43.csv")]
+SUMMARY_FILE = "summary.txt"
 
 DAYS = [
     "Monday",
@@ -20,30 +26,6 @@ DAYS = [
     "Sunday"
 ]
 
-def convert_data(line: list) -> list:
-    """Convert one CSV row into correct data types."""
-    converted = []
-    converted.append(datetime.fromisoformat(line[0]))  # timestamp
-    converted.append(int(line[1]))
-    converted.append(int(line[2]))
-    converted.append(int(line[3]))
-    converted.append(int(line[4]))
-    converted.append(int(line[5]))
-    converted.append(int(line[6]))
-    return converted
-
-
-def read_data(filename: str) -> list:
-    """Read CSV file and return converted rows."""
-    rows = []
-    with open(filename, "r", encoding="utf-8") as f:
-        next(f)
-        for line in f:
-            fields = line.strip().split(";")
-            rows.append(convert_data(fields))
-    return rows
-
-
 def day_information(day: date, database: list) -> str:
     """Return formatted daily totals for one date."""
     c1 = c2 = c3 = 0
@@ -58,39 +40,62 @@ def day_information(day: date, database: list) -> str:
             p2 += per_hour[5] / 1000
             p3 += per_hour[6] / 1000
 
-    # format numbers
-    f1 = f"{c1:.2f}".replace(".", ",")
-    f2 = f"{c2:.2f}".replace(".", ",")
-    f3 = f"{c3:.2f}".replace(".", ",")
-    g1 = f"{p1:.2f}".replace(".", ",")
-    g2 = f"{p2:.2f}".replace(".", ",")
-    g3 = f"{p3:.2f}".replace(".", ",")
+    return format_day(day, (c1, c2, c3, p1, p2, p3))
 
+
+def format_day(day: date, totals) -> str:
+    """Format one day's six phase totals (kWh) as a report line."""
+    f1, f2, f3, g1, g2, g3 = (f"{x:.2f}".replace(".", ",") for x in totals)
     return f'{day.strftime("%d.%m.%Y"):<15}{f1:<8}{f2:<8}{f3:<13}{g1:<8}{g2:<8}{g3:<8}'
 
 
-def write_week(week_number: int, database: list, file):
-    """Write one week's report section."""
-    file.write(f"Week {week_number} electricity consumption and production (kWh, by phase)\n\n")
-    file.write("Day         Date            Consumption [kWh]             Production [kWh]\n")
-    file.write("          (dd.mm.yyyy)     v1     v2     v3              v1      v2     v3\n")
-    file.write("-----------------------------------------------------------------------------\n")
+def week_header(week_number: int) -> str:
+    """Heading lines of one week's report section."""
+    return (
+        f"Week {week_number} electricity consumption and production (kWh, by phase)\n\n"
+        "Day         Date            Consumption [kWh]             Production [kWh]\n"
+        "          (dd.mm.yyyy)     v1     v2     v3              v1      v2     v3\n"
+        "-----------------------------------------------------------------------------\n"
+    )
+
 
-    # all dates in this week
-    all_dates = sorted({row[0].date() for row in database})
+def daily_totals(database: list) -> dict:
+    """Per-day phase totals (kWh) in one pass over the rows."""
+    days = {}
+    for row in database:
+        sums = days.get(row[0].date())
+        if sums is None:
+            sums = days[row[0].date()] = [0, 0, 0, 0, 0, 0]
+        sums[0] += row[1] / 1000
+        sums[1] += row[2] / 1000
+        sums[2] += row[3] / 1000
+        sums[3] += row[4] / 1000
+        sums[4] += row[5] / 1000
+        sums[5] += row[6] / 1000
+    return days
+
+
+def week_section(week_number: int, database: list) -> str:
+    """One week's report section as a string."""
+    days = daily_totals(database)
+    parts = [week_header(week_number)]
+    for d in sorted(days):
+        parts.append(f"{DAYS[d.weekday()]:<10} {format_day(d, days[d])}\n")
+    parts.append("\n\n")
+    return "".join(parts)
 
-    for d in all_dates:
-        weekday = DAYS[d.weekday()]
-        file.write(f"{weekday:<10} {day_information(d, database)}\n")
 
-    file.write("\n\n")
+def write_week(week_number: int, database: list, file):
+    """Write one week's report section."""
+    file.write(week_section(week_number, database))
+
 
-def total_summary(week41: list, week42: list, week43: list) -> str:
+def total_summary(*weeks: list) -> str:
     """Return total consumption and production for all weeks."""
     c1 = c2 = c3 = 0
     p1 = p2 = p3 = 0
 
-    for db in (week41, week42, week43):
+    for db in weeks:
         for row in db:
             c1 += row[1] / 1000
             c2 += row[2] / 1000
@@ -99,7 +104,13 @@ def total_summary(week41: list, week42: list, week43: list) -> str:
             p2 += row[5] / 1000
             p3 += row[6] / 1000
 
-    # format
+    return format_totals((c1, c2, c3), (p1, p2, p3))
+
+
+def format_totals(consumption, production) -> str:
+    """Format the combined phase totals (kWh) of all weeks."""
+    c1, c2, c3 = consumption
+    p1, p2, p3 = production
     f = lambda x: f"{x:.2f}".replace(".", ",")
 
     return (
@@ -110,18 +121,25 @@ def total_summary(week41: list, week42: list, week43: list) -> str:
 
 
 def main() -> None:
-    """Read 3 weeks and write summary.txt."""
-    week41 = read_data("week41.csv")
-    week42 = read_data("week42.csv")
-    week43 = read_data("week43.csv")
-
-    with open("summary.txt", "w", encoding="utf-8") as f:
-        write_week(41, week41, f)
-        write_week(42, week42, f)
-        write_week(43, week43, f)
-        
+    """Read the WEEKS and write SUMMARY_FILE."""
+    if "--watch" in sys.argv:
+        # keep summary.txt up to date while rows are appended to the CSVs
+        from watch import watch
+        watch()
+        return
+    if "--parallel" in sys.argv:
+        # sections computed concurrently, optionally also one file per week
+        from pipeline import main as pipeline_main
+        pipeline_main([a for a in sys.argv[1:] if a != "--parallel"])
+        return
+    weeks = [(week_number, read_data(filename)) for week_number, filename in WEEKS]
+
+    with open(SUMMARY_FILE, "w", encoding="utf-8") as f:
+        for week_number, database in weeks:
+            write_week(week_number, database, f)
+
         #combined totals for all weeks
-        f.write(total_summary(week41, week42, week43))
+        f.write(total_summary(*(database for _, database in weeks)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# Modified by nnn according to given task
+
+"""
+Live mode for summary.txt: python task_e.py --watch
+
+The week CSVs are polled; only rows appended since the last poll are parsed
+and added to the per-day phase totals.  Only the section of a week whose
+file changed is re-rendered, and summary.txt is replaced atomically
+(temp file + rename), so readers never see a half-written report.
+"""
+
+import time
+
+import _bootstrap  # noqa: F401
+from task_e import DAYS, SUMMARY_FILE, WEEKS, convert_data, format_day, format_totals, week_header
+from taskcore.tail import AppendReader, write_atomic
+POLL_INTERVAL = 0.2  # seconds
+
+
+class WeekState:
+    """Running per-day phase totals and the rendered section of one week."""
+
+    def __init__(self, week_number: int, path: str):
+        self.week_number = week_number
+        self.reader = AppendReader(path)
+        self.days = {}
+        self.totals = [0.0] * 6
+        self.tail = b""
+        self.section = ""
+        self.view_totals = self.totals
+
+    def update(self) -> bool:
+        """Parse appended rows; returns True if the section changed."""
+        lines, reset = self.reader.poll()
+        if reset:
+            self.days = {}
+            self.totals = [0.0] * 6
+        for line in lines:
+            row = self.convert(line)
+            if row is None:
+                continue  # blank or malformed row: skipped, the watch keeps running
+            sums = self.days.setdefault(row[0].date(), [0.0] * 6)
+            for i in range(6):
+                value = row[i + 1] / 1000
+                sums[i] += value
+                self.totals[i] += value
+        if not lines and not reset and self.section and self.reader.partial == self.tail:
+            return False
+        self.tail = self.reader.partial
+        self.section = self.render()
+        return True
+
+    @staticmethod
+    def convert(line: str):
+        """convert_data of one line, or None for a blank or malformed line."""
+        fields = line.strip().split(";")
+        if len(fields) != 7:
+            return None
+        try:
+            return convert_data(fields)
+        except ValueError:
+            return None
+
+    def provisional_row(self):
+        """The last line when it has no newline yet (CSV files end without one)."""
+        return self.convert(self.tail.decode("utf-8", errors="replace"))
+
+    def render(self) -> str:
+        days = self.days
+        self.view_totals = self.totals
+        row = self.provisional_row()
+        if row is not None:
+            d = row[0].date()
+            days = dict(days)
+            days[d] = [x + row[i + 1] / 1000 for i, x in enumerate(days.get(d, [0.0] * 6))]
+            self.view_totals = [x + row[i + 1] / 1000 for i, x in enumerate(self.totals)]
+
+        parts = [week_header(self.week_number)]
+        for d in sorted(days):
+            parts.append(f"{DAYS[d.weekday()]:<10} {format_day(d, days[d])}\n")
+        parts.append("\n\n")
+        return "".join(parts)
+
+
+def build_summary(weeks: list) -> str:
+    consumption = [sum(w.view_totals[i] for w in weeks) for i in range(3)]
+    production = [sum(w.view_totals[i] for w in weeks) for i in range(3, 6)]
+    return "".join(w.section for w in weeks) + format_totals(consumption, production)
+
+
+def watch(weeks=WEEKS, summary_file: str = SUMMARY_FILE, interval: float = POLL_INTERVAL) -> None:
+    """Poll the week files and rewrite the summary whenever rows are appended."""
+    states = [WeekState(number, path) for number, path in weeks]
+    print(f"Watching {', '.join(path for _, path in weeks)} (Ctrl+C to stop)")
+    try:
+        while True:
+            changed = [s.week_number for s in states if s.update()]
+            if changed:
+                write_atomic(summary_file, build_summary(states))
+                print(f"{time.strftime('%d.%m.%Y %H:%M:%S')} updated weeks {', '.join(map(str, changed))}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
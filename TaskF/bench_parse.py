@@ -0,0 +1,126 @@
+"""
+Benchmark of the comma-decimal parsing strategies for the hourly CSV,
+with exact-equality checks of the yearly totals against report.txt.
+
+Only the numeric columns are timed (timestamps are parsed the same way by
+every strategy).  report.txt was produced in Finnish local time, so the
+check runs with TZ=Europe/Helsinki.
+
+Usage:
+  python bench_parse.py [CSV_FILE] [--repeat N]
+"""
+import argparse
+import csv
+import os
+import re
+import time
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from task_f import (CSV_FILE, REPORT_FILE, calc_range, format_number,
+                    parse_milli, read_data, report_lines)
+
+NUMBER_FIELDS = re.compile(r";(-?\d+),?(\d*);(-?\d+),?(\d*);(-?\d+),?(\d*)")
+COMMA_TO_DOT = str.maketrans(",", ".")
+
+
+def numbers_replace(lines: List[str]) -> List[Tuple[float, float, float]]:
+    """Original path: csv.reader + str.replace per field."""
+    out = []
+    for r in csv.reader(lines, delimiter=";"):
+        out.append((float(r[1].replace(",", ".")), float(r[2].replace(",", ".")),
+                    float(r[3].replace(",", "."))))
+    return out
+
+
+def numbers_translate(lines: List[str]) -> List[Tuple[float, float, float]]:
+    """One str.translate per line, then split."""
+    out = []
+    for line in lines:
+        r = line.translate(COMMA_TO_DOT).split(";")
+        out.append((float(r[1]), float(r[2]), float(r[3])))
+    return out
+
+
+def numbers_line_replace(lines: List[str]) -> List[Tuple[float, float, float]]:
+    """read_data path: one str.replace per line, then split."""
+    out = []
+    for line in lines:
+        r = line.replace(",", ".").split(";")
+        out.append((float(r[1]), float(r[2]), float(r[3])))
+    return out
+
+
+def numbers_regex(lines: List[str]) -> List[Tuple[float, float, float]]:
+    """Precompiled regex extracting all numeric fields at once."""
+    out = []
+    for line in lines:
+        a, b, c, d, e, f = NUMBER_FIELDS.search(line).groups()
+        out.append((float(f"{a}.{b or 0}"), float(f"{c}.{d or 0}"), float(f"{e}.{f or 0}")))
+    return out
+
+
+def numbers_fixed(lines: List[str]) -> List[Tuple[int, int, int]]:
+    """Fixed-point integers (Wh, Wh, 0.001 °C)."""
+    out = []
+    for line in lines:
+        r = line.split(";")
+        out.append((parse_milli(r[1]), parse_milli(r[2]), parse_milli(r[3])))
+    return out
+
+
+def bench(name: str, fn: Callable, lines: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(lines)
+        best = min(best, time.perf_counter() - t0)
+    print(f"{name:<14}{best * 1000:>9.2f} ms{len(lines) / best:>14,.0f} rows/s")
+    return best
+
+
+def check_report(filename: str) -> bool:
+    """Yearly report from read_data and from fixed-point sums must equal report.txt."""
+    with open(REPORT_FILE, "r", encoding="utf-8") as f:
+        expected = f.read().splitlines()
+    rows = read_data(filename)
+    stats = calc_range(rows, datetime(2025, 1, 1), datetime(2025, 12, 31))
+    ok = report_lines("Report for the year: 2025", stats) == expected
+    print(f"read_data yearly report == {REPORT_FILE}: {ok}")
+
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()[1:]
+    # rows and lines line up one to one: 2025.csv has no skipped rows
+    fixed = [n for r, n in zip(rows, numbers_fixed(lines)) if r["ts"].year == 2025]
+    cons_wh = sum(n[0] for n in fixed)
+    prod_wh = sum(n[1] for n in fixed)
+    exact = (f"- Total consumption: {format_number(cons_wh / 1000)} kWh" == expected[2]
+             and f"- Total production: {format_number(prod_wh / 1000)} kWh" == expected[3])
+    print(f"fixed-point totals ({cons_wh} Wh, {prod_wh} Wh) == {REPORT_FILE}: {exact}")
+    return ok and exact
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Comma-decimal parsing benchmark")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["TZ"] = "Europe/Helsinki"
+    time.tzset()
+
+    with open(args.csv_file, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()[1:]
+    print(f"{len(lines)} rows, best of {args.repeat}")
+    reference = numbers_replace(lines)
+    for name, fn in (("replace", numbers_replace), ("line-replace", numbers_line_replace),
+                     ("translate", numbers_translate),
+                     ("regex", numbers_regex), ("fixed", numbers_fixed)):
+        bench(name, fn, lines, args.repeat)
+        if fn is not numbers_fixed and fn(lines) != reference:
+            print(f"  {name}: values differ from the original parser!")
+    check_report(args.csv_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+Columnar export of the hourly and aggregated energy data.
+
+The default format is a small pure-stdlib packed file:
+
+  b"ECOL1\\n" | uint32 header length | JSON header | column blocks
+
+Every column is one contiguous block of fixed-width values (array.array
+'q' int64 or 'd' float64), and the JSON header holds each block's offset.
+Readers therefore load only the columns they ask for (projection), and
+because the key column is sorted, a key range is found by binary search
+and only that slice of the other columns is read (range filtering).
+
+With pyarrow installed the same tables can also be written as Arrow IPC
+(.arrow) or Parquet (.parquet) files, read with the same options.
+
+Exports:
+  hourly  TaskF hourly rows: time (UTC epoch s), cons, prod (kWh), temp
+  daily   TaskF daily rollup: day (yyyymmdd), cons, prod, avg_temp, hours
+  phases  TaskE per-day per-phase totals: day, c1..c3, p1..p3 (Wh)
+
+Usage:
+  python columnar.py hourly 2025.csv [2026.csv ...] -o hourly.ecol
+  python columnar.py daily 2025.csv [site2.csv ...] -o daily.ecol
+  python columnar.py phases ../TaskE/week41.csv ../TaskE/week42.csv -o phases.ecol
+  python columnar.py read daily.ecol --columns day,cons --from 01.03.2025 --to 31.03.2025
+"""
+import argparse
+import json
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from energy_store import parse_rows
+from task_f import read_data
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional
+    pyarrow = None
+
+MAGIC = b"ECOL1\n"
+Columns = Dict[str, Tuple[str, Sequence]]  # name -> (typecode, values)
+
+
+def write_packed(path: str, columns: Columns, key: str, key_kind: str) -> None:
+    """Writes columns (all the same length, key column sorted) to a packed file."""
+    blocks = []
+    meta = []
+    offset = 0
+    for name, (typecode, values) in columns.items():
+        data = array(typecode, values).tobytes()
+        meta.append({"name": name, "type": typecode, "offset": offset, "length": len(values)})
+        blocks.append(data)
+        offset += len(data)
+    keys = columns[key][1]
+    if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+        raise ValueError(f"key column {key} is not sorted")
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "rows": len(keys),
+        "key": key,
+        "key_kind": key_kind,
+        "columns": meta,
+    }).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for data in blocks:
+            f.write(data)
+
+
+def read_header(f) -> Tuple[dict, int]:
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a packed column file")
+    (length,) = struct.unpack("<I", f.read(4))
+    header = json.loads(f.read(length))
+    return header, len(MAGIC) + 4 + length
+
+
+def _read_block(f, base: int, meta: dict, start: int, stop: int, swap: bool) -> array:
+    values = array(meta["type"])
+    f.seek(base + meta["offset"] + start * values.itemsize)
+    values.frombytes(f.read((stop - start) * values.itemsize))
+    if swap:
+        values.byteswap()
+    return values
+
+
+def read_packed(path: str, columns: Optional[List[str]] = None,
+                key_range: Optional[Tuple[float, float]] = None) -> Dict[str, list]:
+    """
+    Reads a packed file. columns limits the columns loaded; key_range
+    (inclusive) limits the rows by the key column.
+    """
+    with open(path, "rb") as f:
+        header, base = read_header(f)
+        swap = header["byteorder"] != sys.byteorder
+        metas = {m["name"]: m for m in header["columns"]}
+        start, stop = 0, header["rows"]
+        if key_range is not None:
+            keys = _read_block(f, base, metas[header["key"]], 0, header["rows"], swap)
+            start = bisect_left(keys, key_range[0])
+            stop = bisect_right(keys, key_range[1])
+        names = columns or list(metas)
+        return {name: _read_block(f, base, metas[name], start, stop, swap).tolist() for name in names}
+
+
+def write_table(path: str, columns: Columns, key: str, key_kind: str) -> None:
+    """Writes packed, Arrow IPC or Parquet depending on the file extension."""
+    if path.endswith((".arrow", ".parquet")):
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is required for .arrow and .parquet files")
+        table = pyarrow.table({name: list(values) for name, (_, values) in columns.items()})
+        table = table.replace_schema_metadata({"key": key, "key_kind": key_kind})
+        if path.endswith(".parquet"):
+            pyarrow.parquet.write_table(table, path)
+        else:
+            pyarrow.feather.write_feather(table, path, compression="uncompressed")
+    else:
+        write_packed(path, columns, key, key_kind)
+
+
+def read_table(path: str, columns: Optional[List[str]] = None,
+               key_range: Optional[Tuple[float, float]] = None) -> Dict[str, list]:
+    """Reads any of the supported formats with projection and key range filtering."""
+    if not path.endswith((".arrow", ".parquet")):
+        return read_packed(path, columns, key_range)
+    if pyarrow is None:
+        raise RuntimeError("pyarrow is required for .arrow and .parquet files")
+    if path.endswith(".parquet"):
+        schema = pyarrow.parquet.read_schema(path)
+        key = schema.metadata[b"key"].decode()
+        filters = [(key, ">=", key_range[0]), (key, "<=", key_range[1])] if key_range else None
+        return pyarrow.parquet.read_table(path, columns=columns, filters=filters).to_pydict()
+    table = pyarrow.feather.read_table(path)
+    if key_range is not None:
+        import pyarrow.compute as pc
+        key = table.schema.metadata[b"key"].decode()
+        table = table.filter(pc.and_(pc.greater_equal(table[key], key_range[0]),
+                                     pc.less_equal(table[key], key_range[1])))
+    if columns:
+        table = table.select(columns)
+    return table.to_pydict()
+
+
+def table_key_kind(path: str) -> str:
+    """The key_kind stored with a table ("epoch" or "yyyymmdd")."""
+    if not path.endswith((".arrow", ".parquet")):
+        with open(path, "rb") as f:
+            return read_header(f)[0]["key_kind"]
+    if pyarrow is None:
+        raise RuntimeError("pyarrow is required for .arrow and .parquet files")
+    if path.endswith(".parquet"):
+        schema = pyarrow.parquet.read_schema(path)
+    else:
+        schema = pyarrow.ipc.open_file(path).schema
+    return schema.metadata[b"key_kind"].decode()
+
+
+def table_columns(path: str) -> List[str]:
+    """The column names of a table, in file order."""
+    if not path.endswith((".arrow", ".parquet")):
+        with open(path, "rb") as f:
+            return [m["name"] for m in read_header(f)[0]["columns"]]
+    if pyarrow is None:
+        raise RuntimeError("pyarrow is required for .arrow and .parquet files")
+    if path.endswith(".parquet"):
+        return pyarrow.parquet.read_schema(path).names
+    return pyarrow.ipc.open_file(path).schema.names
+
+
+def yyyymmdd(d) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def hourly_columns(csv_files: List[str]) -> Columns:
+    """Rows of all files in UTC order (an instant in several files is kept from each)."""
+    rows = sorted((r for csv_file in csv_files for r in read_data(csv_file)), key=lambda r: r["utc"])
+    return {
+        "time": ("q", [int(r["utc"].timestamp()) for r in rows]),
+        "cons": ("d", [r["cons"] for r in rows]),
+        "prod": ("d", [r["prod"] for r in rows]),
+        "temp": ("d", [r["temp"] for r in rows]),
+    }
+
+
+def daily_columns(csv_files: List[str]) -> Columns:
+    """Per-day sums over all files (e.g. all sites, or the years of one meter)."""
+    days: Dict[int, List[float]] = {}
+    for r in (r for csv_file in csv_files for r in read_data(csv_file)):
+        bucket = days.setdefault(yyyymmdd(r["ts"]), [0.0, 0.0, 0.0, 0])
+        bucket[0] += r["cons"]
+        bucket[1] += r["prod"]
+        bucket[2] += r["temp"]
+        bucket[3] += 1
+    keys = sorted(days)
+    return {
+        "day": ("q", keys),
+        "cons": ("d", [days[k][0] for k in keys]),
+        "prod": ("d", [days[k][1] for k in keys]),
+        "avg_temp": ("d", [days[k][2] / days[k][3] for k in keys]),
+        "hours": ("q", [days[k][3] for k in keys]),
+    }
+
+
+def phase_columns(csv_files: List[str]) -> Columns:
+    names = ["c1", "c2", "c3", "p1", "p2", "p3"]
+    days: Dict[int, List[int]] = {}
+    for csv_file in csv_files:
+        for row in parse_rows(csv_file):
+            bucket = days.setdefault(yyyymmdd(row[0]), [0] * 6)
+            for i in range(6):
+                bucket[i] += row[i + 1] or 0
+    keys = sorted(days)
+    columns: Columns = {"day": ("q", keys)}
+    for i, name in enumerate(names):
+        columns[name] = ("q", [days[k][i] for k in keys])
+    return columns
+
+
+def parse_key(text: str, key_kind: str, end: bool) -> float:
+    """dd.mm.yyyy -> key value (yyyymmdd, or UTC epoch seconds of the local day)."""
+    d = datetime.strptime(text, "%d.%m.%Y")
+    if key_kind == "yyyymmdd":
+        return yyyymmdd(d)
+    if end:
+        d = d.replace(hour=23, minute=59, second=59)
+    return d.astimezone(timezone.utc).timestamp()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Columnar export of energy data")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("hourly", "daily", "phases"):
+        p = sub.add_parser(name)
+        p.add_argument("files", nargs="+")
+        p.add_argument("-o", "--output", required=True)
+    p_read = sub.add_parser("read")
+    p_read.add_argument("file")
+    p_read.add_argument("--columns")
+    p_read.add_argument("--from", dest="start")
+    p_read.add_argument("--to", dest="end")
+    args = parser.parse_args(argv)
+
+    if args.command == "read":
+        key_kind = table_key_kind(args.file)
+        key_range = None
+        if args.start or args.end:
+            key_range = (parse_key(args.start, key_kind, False) if args.start else float("-inf"),
+                         parse_key(args.end, key_kind, True) if args.end else float("inf"))
+        columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+        if columns:
+            valid = table_columns(args.file)
+            unknown = [c for c in columns if c not in valid]
+            if unknown:
+                parser.error(f"unknown column(s) {', '.join(unknown)} in {args.file} "
+                             f"(choose from {', '.join(valid)})")
+        table = read_table(args.file, columns, key_range)
+        names = list(table)
+        print(";".join(names))
+        for values in zip(*(table[n] for n in names)):
+            print(";".join(str(v) for v in values))
+        return
+
+    if args.command == "hourly":
+        columns, key, kind = hourly_columns(args.files), "time", "epoch"
+    elif args.command == "daily":
+        columns, key, kind = daily_columns(args.files), "day", "yyyymmdd"
+    else:
+        columns, key, kind = phase_columns(args.files), "day", "yyyymmdd"
+    write_table(args.output, columns, key, kind)
+    print(f"{len(columns[key][1])} rows written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+SQLite store for meter data with pre-aggregated rollup tables.
+
+Loads the phase-split weekly CSVs (TaskD/TaskE) and the net-format yearly
+CSV (TaskF) into one database.  Every inserted hour is also added to a
+daily and a monthly rollup row, so report queries only read a handful of
+pre-summed rows instead of re-parsing and re-summing the hourly data.
+
+Energy is stored as integer watt-hours so sums are exact.
+
+Usage:
+  python energy_store.py ingest [--meter NAME] FILE [FILE ...]
+  python energy_store.py day dd.mm.yyyy
+  python energy_store.py range dd.mm.yyyy dd.mm.yyyy
+  python energy_store.py summary dd.mm.yyyy dd.mm.yyyy
+"""
+import argparse
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from task_f import detect_delimiter, format_number, parse_milli, parse_timestamp
+
+DB_FILE = "energy.db"
+DEFAULT_METER = "default"
+
+DAYS = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday"
+]
+
+# c1..c3 / p1..p3 are phase consumption / production, cons / prod the totals (all Wh)
+VALUE_COLUMNS = ["c1", "c2", "c3", "p1", "p2", "p3", "cons", "prod"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hourly (
+    meter TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    fold INTEGER NOT NULL,
+    c1 INTEGER, c2 INTEGER, c3 INTEGER,
+    p1 INTEGER, p2 INTEGER, p3 INTEGER,
+    cons INTEGER NOT NULL,
+    prod INTEGER NOT NULL,
+    temp REAL,
+    PRIMARY KEY (meter, ts, fold)
+);
+CREATE TABLE IF NOT EXISTS daily (
+    meter TEXT NOT NULL,
+    day TEXT NOT NULL,
+    c1 INTEGER, c2 INTEGER, c3 INTEGER,
+    p1 INTEGER, p2 INTEGER, p3 INTEGER,
+    cons INTEGER, prod INTEGER,
+    temp_sum REAL, temp_count INTEGER, hours INTEGER,
+    PRIMARY KEY (meter, day)
+);
+CREATE TABLE IF NOT EXISTS monthly (
+    meter TEXT NOT NULL,
+    month TEXT NOT NULL,
+    c1 INTEGER, c2 INTEGER, c3 INTEGER,
+    p1 INTEGER, p2 INTEGER, p3 INTEGER,
+    cons INTEGER, prod INTEGER,
+    temp_sum REAL, temp_count INTEGER, hours INTEGER,
+    PRIMARY KEY (meter, month)
+);
+"""
+
+ROLLUP_COLUMNS = VALUE_COLUMNS + ["temp_sum", "temp_count", "hours"]
+
+
+def connect(path: str = DB_FILE) -> sqlite3.Connection:
+    """Open the database and create the tables if needed."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def parse_rows(filename: str) -> Iterator[Tuple]:
+    """
+    Yield (ts, c1, c2, c3, p1, p2, p3, cons, prod, temp) tuples from either
+    the 7-column phase format (Wh) or the 4-column net format (kWh).
+    The repeated local hour at the end of DST gets ts.fold = 1.
+    """
+    previous = None
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline()
+        if not header:
+            return
+        delim = detect_delimiter(header)
+        phase_format = len(header.split(delim)) >= 7
+        for line in f:
+            fields = line.strip().split(delim)
+            if phase_format:
+                if len(fields) < 7:
+                    continue
+                ts = parse_timestamp(fields[0])
+                if ts == previous:
+                    ts = ts.replace(fold=1)
+                previous = ts
+                c1, c2, c3, p1, p2, p3 = (int(x) for x in fields[1:7])
+                yield ts, c1, c2, c3, p1, p2, p3, c1 + c2 + c3, p1 + p2 + p3, None
+            else:
+                if len(fields) < 4:
+                    continue
+                ts = parse_timestamp(fields[0])
+                if ts == previous:
+                    ts = ts.replace(fold=1)
+                previous = ts
+                temp = float(fields[3].strip().replace(",", "."))
+                yield (ts, None, None, None, None, None, None,
+                       parse_milli(fields[1]), parse_milli(fields[2]), temp)
+
+
+def _add(bucket: List, row: Tuple) -> None:
+    """Add one hourly row into a rollup accumulator."""
+    for i in range(8):
+        if row[i + 1] is not None:
+            bucket[i] = (bucket[i] or 0) + row[i + 1]
+    if row[9] is not None:
+        bucket[8] += row[9]
+        bucket[9] += 1
+    bucket[10] += 1
+
+
+def _upsert(conn: sqlite3.Connection, table: str, key: str, deltas: Dict[str, List]) -> None:
+    """Add accumulated deltas into a rollup table."""
+    cols = ", ".join(ROLLUP_COLUMNS)
+    marks = ", ".join("?" for _ in ROLLUP_COLUMNS)
+    updates = ", ".join(
+        f"{c} = CASE WHEN excluded.{c} IS NULL THEN {c} ELSE coalesce({c}, 0) + excluded.{c} END"
+        for c in ROLLUP_COLUMNS
+    )
+    conn.executemany(
+        f"INSERT INTO {table} (meter, {key}, {cols}) VALUES (?, ?, {marks}) "
+        f"ON CONFLICT (meter, {key}) DO UPDATE SET {updates}",
+        [(meter, k, *values) for (meter, k), values in deltas.items()],
+    )
+
+
+def ingest(conn: sqlite3.Connection, filename: str, meter: str = DEFAULT_METER) -> int:
+    """
+    Load one CSV file into the hourly table and update the rollups.
+    Hours already stored for the meter are skipped, so re-ingesting is safe.
+
+    Returns:
+        Number of new hourly rows
+    """
+    daily: Dict[Tuple[str, str], List] = {}
+    monthly: Dict[Tuple[str, str], List] = {}
+    inserted = 0
+    with conn:
+        for row in parse_rows(filename):
+            ts = row[0]
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO hourly VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (meter, ts.isoformat(sep=" "), ts.fold, *row[1:]),
+            )
+            if cur.rowcount != 1:
+                continue
+            inserted += 1
+            day_key = (meter, ts.strftime("%Y-%m-%d"))
+            month_key = (meter, ts.strftime("%Y-%m"))
+            _add(daily.setdefault(day_key, [None] * 8 + [0.0, 0, 0]), row)
+            _add(monthly.setdefault(month_key, [None] * 8 + [0.0, 0, 0]), row)
+        _upsert(conn, "daily", "day", daily)
+        _upsert(conn, "monthly", "month", monthly)
+    return inserted
+
+
+def _sum_rows(rows: List[Tuple]) -> Dict[str, float]:
+    """Sum rollup rows (columns in ROLLUP_COLUMNS order)."""
+    totals = dict.fromkeys(ROLLUP_COLUMNS, 0)
+    for row in rows:
+        for name, value in zip(ROLLUP_COLUMNS, row):
+            if value is not None:
+                totals[name] += value
+    return totals
+
+
+def range_totals(conn: sqlite3.Connection, start: date, end: date,
+                 meter: str = DEFAULT_METER) -> Dict[str, float]:
+    """
+    Rollup totals for an inclusive date range.
+    Whole months are read from the monthly table, the partial months at
+    either end from the daily table.
+    """
+    cols = ", ".join(ROLLUP_COLUMNS)
+    # first day of the first whole month, and first day after the last whole month
+    first = start if start.day == 1 else (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    after_end = end + timedelta(days=1)
+    last = after_end.replace(day=1)
+    rows: List[Tuple] = []
+    if first < last:
+        rows += conn.execute(
+            f"SELECT {cols} FROM monthly WHERE meter = ? AND month >= ? AND month < ?",
+            (meter, first.strftime("%Y-%m"), last.strftime("%Y-%m")),
+        ).fetchall()
+        edges = [(start, first), (last, after_end)]
+    else:
+        edges = [(start, after_end)]
+    for lo, hi in edges:
+        if lo < hi:
+            rows += conn.execute(
+                f"SELECT {cols} FROM daily WHERE meter = ? AND day >= ? AND day < ?",
+                (meter, lo.isoformat(), hi.isoformat()),
+            ).fetchall()
+    return _sum_rows(rows)
+
+
+def calc_range(conn: sqlite3.Connection, start: datetime, end: datetime,
+               meter: str = DEFAULT_METER) -> Dict[str, float]:
+    """Same result as task_f.calc_range, served from the rollups."""
+    t = range_totals(conn, start.date(), end.date(), meter)
+    avg_temp = (t["temp_sum"] / t["temp_count"]) if t["temp_count"] else 0.0
+    return {"cons": t["cons"] / 1000, "prod": t["prod"] / 1000, "avg_temp": avg_temp}
+
+
+def day_information(conn: sqlite3.Connection, day: date, meter: str = DEFAULT_METER) -> str:
+    """Same printable line as TaskD/TaskE day_information, from the daily rollup."""
+    t = range_totals(conn, day, day, meter)
+    values = [f"{t[c] / 1000:.2f}".replace(".", ",") for c in VALUE_COLUMNS[:6]]
+    f1, f2, f3, g1, g2, g3 = values
+    return f'{day.strftime("%d.%m.%Y"):<15}{f1:<8}{f2:<8}{f3:<13}{g1:<8}{g2:<8}{g3:<8}'
+
+
+def total_summary(conn: sqlite3.Connection, start: date, end: date,
+                  meter: str = DEFAULT_METER) -> str:
+    """Phase totals for a date range, same layout as TaskE total_summary."""
+    t = range_totals(conn, start, end, meter)
+    f = lambda c: f"{t[c] / 1000:.2f}".replace(".", ",")
+    return (
+        f"Total consumption and production ({start.strftime('%d.%m.%Y')}–{end.strftime('%d.%m.%Y')})\n"
+        f"Consumption:  v1 {f('c1')}  v2 {f('c2')}  v3 {f('c3')}\n"
+        f"Production:   v1 {f('p1')}  v2 {f('p2')}  v3 {f('p3')}\n"
+    )
+
+
+def _parse_day(s: str) -> datetime:
+    return datetime.strptime(s, "%d.%m.%Y")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Meter data store")
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--meter", default=DEFAULT_METER)
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_ingest = sub.add_parser("ingest", help="load CSV files")
+    p_ingest.add_argument("files", nargs="+")
+    p_day = sub.add_parser("day", help="phase totals for one day")
+    p_day.add_argument("day", type=_parse_day)
+    for name in ("range", "summary"):
+        p = sub.add_parser(name)
+        p.add_argument("start", type=_parse_day)
+        p.add_argument("end", type=_parse_day)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    if args.command == "ingest":
+        for filename in args.files:
+            count = ingest(conn, filename, args.meter)
+            print(f"{filename}: {count} new rows")
+    elif args.command == "day":
+        print(f"{DAYS[args.day.weekday()]:<10}", day_information(conn, args.day.date(), args.meter))
+    elif args.command == "range":
+        stats = calc_range(conn, args.start, args.end, args.meter)
+        print(f"Report for the period {args.start.strftime('%d.%m.%Y')}–{args.end.strftime('%d.%m.%Y')}")
+        print(f"- Total consumption: {format_number(stats['cons'])} kWh")
+        print(f"- Total production: {format_number(stats['prod'])} kWh")
+        print(f"- Average temperature: {format_number(stats['avg_temp'])} °C")
+    else:
+        print(total_summary(conn, args.start.date(), args.end.date(), args.meter), end="")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
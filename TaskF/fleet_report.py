@@ -0,0 +1,135 @@
+"""
+Per-site and fleet-wide reports for a directory of meter files.
+
+Every CSV file in the directory is one site (site name = file name without
+extension) and may contain several years.  Files are loaded concurrently in
+a process pool; each worker returns only its per-day partial sums, and the
+fleet totals are built by adding those partials together, so no rows are
+ever concatenated.
+
+Usage:
+  python fleet_report.py DIRECTORY [-o fleet_report.txt] [--workers N]
+  python task_f.py --fleet DIRECTORY [...]
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from task_f import format_number, read_data, report_lines
+
+FLEET_REPORT_FILE = "fleet_report.txt"
+
+# partial sums per day: [consumption, production, temperature sum, hours]
+Partials = Dict[date, List[float]]
+
+
+def site_partials(path: str) -> Tuple[str, Partials]:
+    """Worker: read one meter file and sum it per day."""
+    site = os.path.splitext(os.path.basename(path))[0]
+    partials: Partials = {}
+    for row in read_data(path):
+        bucket = partials.get(row["ts"].date())
+        if bucket is None:
+            bucket = partials[row["ts"].date()] = [0.0, 0.0, 0.0, 0]
+        bucket[0] += row["cons"]
+        bucket[1] += row["prod"]
+        bucket[2] += row["temp"]
+        bucket[3] += 1
+    return site, partials
+
+
+def merge_partials(target: Dict[Any, List[float]], other: Dict[Any, List[float]]) -> Dict[Any, List[float]]:
+    """Add the partial sums of other into target (associative, order free)."""
+    for key, values in other.items():
+        bucket = target.get(key)
+        if bucket is None:
+            target[key] = list(values)
+        else:
+            for i, v in enumerate(values):
+                bucket[i] += v
+    return target
+
+
+def roll_up(daily: Partials, period: str) -> Dict[Tuple[int, ...], List[float]]:
+    """Sum daily partials into ('month') (year, month) or ('year') (year,) keys."""
+    result: Dict[Tuple[int, ...], List[float]] = {}
+    for day, values in daily.items():
+        key = (day.year, day.month) if period == "month" else (day.year,)
+        merge_partials(result, {key: values})
+    return result
+
+
+def to_stats(values: List[float]) -> Dict[str, float]:
+    """Partial sums -> the stats dict used by report_lines."""
+    cons, prod, temp_sum, count = values
+    return {"cons": cons, "prod": prod, "avg_temp": (temp_sum / count) if count else 0.0}
+
+
+def site_section(title: str, daily: Partials) -> List[str]:
+    """Daily table, monthly table and yearly reports for one site (or the fleet)."""
+    lines: List[str] = ["=====================================================", title]
+    lines.append("")
+    lines.append("Daily (kWh, kWh, °C)")
+    lines.append(f"{'Date':<12}{'Consumption':>14}{'Production':>14}{'Avg temp':>10}")
+    for day in sorted(daily):
+        s = to_stats(daily[day])
+        lines.append(f"{day.strftime('%d.%m.%Y'):<12}{format_number(s['cons']):>14}"
+                     f"{format_number(s['prod']):>14}{format_number(s['avg_temp']):>10}")
+    lines.append("")
+    lines.append("Monthly (kWh, kWh, °C)")
+    lines.append(f"{'Month':<12}{'Consumption':>14}{'Production':>14}{'Avg temp':>10}")
+    monthly = roll_up(daily, "month")
+    for year, month in sorted(monthly):
+        s = to_stats(monthly[(year, month)])
+        lines.append(f"{month:02d}.{year:<9}{format_number(s['cons']):>14}"
+                     f"{format_number(s['prod']):>14}{format_number(s['avg_temp']):>10}")
+    lines.append("")
+    yearly = roll_up(daily, "year")
+    for (year,) in sorted(yearly):
+        lines.extend(report_lines(f"Report for the year: {year}", to_stats(yearly[(year,)])))
+    lines.append("")
+    return lines
+
+
+def build_fleet_report(directory: str, workers: Optional[int] = None) -> List[str]:
+    """Load all meter files concurrently and build the per-site and fleet report."""
+    paths = sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(".csv")
+    )
+    if not paths:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(site_partials, paths))
+
+    lines: List[str] = []
+    fleet: Partials = {}
+    for site, partials in results:
+        lines.extend(site_section(f"Site: {site}", partials))
+        merge_partials(fleet, partials)
+    lines.extend(site_section(f"Fleet ({len(results)} sites)", fleet))
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Per-site and fleet energy reports")
+    parser.add_argument("directory")
+    parser.add_argument("-o", "--output", default=FLEET_REPORT_FILE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    lines = build_fleet_report(args.directory, args.workers)
+    if not lines:
+        print(f"No meter files found in {args.directory}.")
+        return
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Merges unordered hourly CSV exports of several meter gateways into one
+time-ordered stream with the external sort of taskcore.extsort.
+
+Every line is normalized to "time;cons;prod;temp" with dot decimals and
+keyed by its UTC instant, so files with different delimiters, offsets
+and row orders merge correctly.  An hour present in several files is kept
+once (the first file wins).  The stream feeds the yearly aggregation
+directly and can also be written out as one merged CSV.
+
+Usage:
+  python merge_sources.py gateway1.csv gateway2.csv [-o merged.csv] [--run-size N]
+"""
+import argparse
+from typing import Any, Dict, Iterator, List, Optional
+
+import _bootstrap  # noqa: F401
+from task_f import detect_delimiter, parse_datetime_raw, parse_row, report_lines, split_fields, to_utc
+from taskcore.extsort import RUN_SIZE, external_sort
+
+HEADER = "Time;Consumption (net) kWh;Production (net) kWh;Daily average temperature"
+
+
+def keyed_source(filename: str) -> Iterator:
+    """
+    (UTC key, normalized line) of every convertible row of one export.
+    Naive timestamps repeat an hour at the end of DST; their repeat count
+    is added to the key so that hour is not merged away.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline()
+        previous = None
+        repeat = 0
+        for r in split_fields(f, detect_delimiter(header), header):
+            if len(r) < 4:
+                continue
+            try:
+                raw = parse_datetime_raw(r[0])
+                float(r[1]), float(r[2]), float(r[3])
+            except ValueError:
+                continue
+            key = to_utc(raw).strftime("%Y-%m-%dT%H:%M:%S")
+            repeat = repeat + 1 if raw.tzinfo is None and key == previous else 0
+            previous = key
+            yield f"{key}#{repeat}", ";".join(x.strip() for x in r[:4])
+
+
+def merged_lines(filenames: List[str], run_size: int = RUN_SIZE,
+                 stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+    return external_sort((keyed_source(name) for name in filenames), run_size, stats=stats)
+
+
+def rows_of(lines: Iterator[str]) -> Iterator[Dict[str, Any]]:
+    """Rows of normalized lines; a repeated naive hour is the second DST instant."""
+    previous = None
+    for line in lines:
+        row = parse_row(line.split(";"), previous)
+        previous = row["ts"]
+        yield row
+
+
+def merged_rows(filenames: List[str], run_size: int = RUN_SIZE,
+                stats: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """read_data-style rows of all files in UTC order, each hour once."""
+    return rows_of(merged_lines(filenames, run_size, stats))
+
+
+def yearly_totals(rows: Iterator[Dict[str, Any]]) -> Dict[int, Dict[str, float]]:
+    """One pass over a row stream: consumption, production and average temperature per year."""
+    years: Dict[int, List[float]] = {}
+    for row in rows:
+        bucket = years.setdefault(row["ts"].year, [0.0, 0.0, 0.0, 0])
+        bucket[0] += row["cons"]
+        bucket[1] += row["prod"]
+        bucket[2] += row["temp"]
+        bucket[3] += 1
+    return {year: {"cons": b[0], "prod": b[1], "avg_temp": b[2] / b[3] if b[3] else 0.0}
+            for year, b in years.items()}
+
+
+def write_merged(lines: Iterator[str], path: str) -> Iterator[str]:
+    """Writes the stream to a CSV (comma decimals, like the exports) and passes it on."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        for line in lines:
+            fields = line.split(";")
+            f.write("\n" + ";".join([fields[0]] + [x.replace(".", ",") for x in fields[1:]]))
+            yield line
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Merge unordered meter exports in time order")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("-o", "--output", help="also write the merged rows to this CSV")
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE, help="rows sorted in memory at a time")
+    args = parser.parse_args(argv)
+
+    stats: Dict[str, int] = {}
+    lines = merged_lines(args.files, args.run_size, stats)
+    if args.output:
+        lines = write_merged(lines, args.output)
+    totals = yearly_totals(rows_of(lines))
+
+    print(f"{stats.get('rows', 0)} rows from {len(args.files)} files "
+          f"({stats.get('duplicates', 0)} duplicates dropped, {stats.get('runs', 0)} sorted runs)")
+    for year in sorted(totals):
+        for line in report_lines(f"Year {year}", totals[year]):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Sparse month-offset index and lazy per-month loading for the hourly CSV.
+
+The index maps every "YYYY-MM" prefix found at the start of a data line to
+the byte span(s) holding that month.  It is built with one cheap byte scan
+(no timestamp or number parsing) and saved next to the CSV as a sidecar
+file, which is reused as long as the CSV size and modification time match.
+
+MonthLoader then seeks to the spans of the requested months, parses only
+those lines and keeps the parsed months in a small LRU cache.  Months are
+those of the timestamps as written in the file (the meter's offset), while
+the reports filter on host local time; a range therefore also loads the
+months within a day of its ends.  Files with lines the scan cannot place
+(e.g. dd.mm.yyyy timestamps) are read whole with read_data instead.
+
+Usage:
+  python month_index.py --check [CSV_FILE]   compare with read_data per month
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from task_f import CSV_FILE, calc_range, detect_delimiter, parse_row, read_data, split_fields
+
+INDEX_SUFFIX = ".idx"
+MONTH_PREFIX = re.compile(rb"^(\d{4}-\d{2})")
+
+# UTC offsets shift a row by less than a day across a month edge
+MARGIN = timedelta(days=1)
+CHECK_TIMEZONES = ("UTC", "America/New_York", "Asia/Tokyo", "Europe/Helsinki")
+
+# month key ("YYYY-MM") -> list of [start, end) byte spans
+Spans = Dict[str, List[List[int]]]
+
+
+def scan_months(filename: str) -> Tuple[str, Spans, int, int]:
+    """Byte scan of the file: returns (delimiter, month spans, data lines, lines without a month)."""
+    spans: Spans = {}
+    rows = unindexed = 0
+    with open(filename, "rb") as f:
+        header = f.readline()
+        delim = detect_delimiter(header.decode("utf-8", errors="replace"))
+        offset = len(header)
+        current: Optional[List[int]] = None
+        current_key = None
+        for line in f:
+            m = MONTH_PREFIX.match(line)
+            if m:
+                rows += 1
+                key = m.group(1).decode("ascii")
+                if key == current_key and current is not None and current[1] == offset:
+                    current[1] = offset + len(line)
+                else:
+                    current = [offset, offset + len(line)]
+                    current_key = key
+                    spans.setdefault(key, []).append(current)
+            elif line.strip():
+                unindexed += 1
+            offset += len(line)
+    return delim, spans, rows, unindexed
+
+
+def load_index(filename: str) -> Tuple[str, Spans, int, int]:
+    """Returns the month index, reading the sidecar or rebuilding it when stale."""
+    st = os.stat(filename)
+    sidecar = filename + INDEX_SUFFIX
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored["size"] == st.st_size and stored["mtime_ns"] == st.st_mtime_ns:
+            return stored["delimiter"], stored["months"], stored["rows"], stored["unindexed"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    delim, spans, rows, unindexed = scan_months(filename)
+    try:
+        with open(sidecar, "w", encoding="utf-8") as f:
+            json.dump({"size": st.st_size, "mtime_ns": st.st_mtime_ns, "delimiter": delim,
+                       "months": spans, "rows": rows, "unindexed": unindexed}, f)
+    except OSError:
+        pass  # read-only location: the index just isn't persisted
+    return delim, spans, rows, unindexed
+
+
+def months_between(start: datetime, end: datetime) -> List[str]:
+    """"YYYY-MM" keys for every month touched by the inclusive range."""
+    keys = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        keys.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return keys
+
+
+class MonthLoader:
+    """Loads rows of the hourly CSV one month at a time, with an LRU cache."""
+
+    def __init__(self, filename: str, cache_size: int = 6):
+        self.filename = filename
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._all: Optional[List[Dict[str, Any]]] = None  # whole file, when it can't be indexed
+        self.fingerprint: Tuple = ()
+        self.refresh()
+
+    def _stat(self) -> Tuple:
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            return (self.filename, None, None)
+        return (self.filename, st.st_size, st.st_mtime_ns)
+
+    def refresh(self) -> bool:
+        """
+        Reloads the index if the file changed since it was loaded.
+
+        Returns:
+            True when the data changed (parsed months were dropped)
+        """
+        fingerprint = self._stat()
+        if fingerprint == self.fingerprint:
+            return False
+        self.fingerprint = fingerprint
+        self._cache.clear()
+        self._all = None
+        try:
+            self.delimiter, self.months, self.rows, unindexed = load_index(self.filename)
+        except FileNotFoundError:
+            self.delimiter, self.months, self.rows, unindexed = ";", {}, 0, 0
+        if unindexed:
+            self._all = read_data(self.filename)
+            self.rows = len(self._all)
+        return True
+
+    def __len__(self) -> int:
+        """Number of data rows (lines of the indexed months, or rows read whole)."""
+        return self.rows
+
+    def _parse_month(self, key: str) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        previous = None
+        with open(self.filename, "rb") as f:
+            for start, end in self.months.get(key, []):
+                f.seek(start)
+                text = f.read(end - start).decode("utf-8")
+                for r in split_fields(text.splitlines(), self.delimiter):
+                    if len(r) < 4:
+                        continue
+                    try:
+                        rows.append(parse_row(r, previous))
+                    except Exception:
+                        continue
+                    previous = rows[-1]["ts"]
+        return rows
+
+    def rows_for_month(self, key: str) -> List[Dict[str, Any]]:
+        """Parsed rows of one month ("YYYY-MM"), from the cache when possible."""
+        rows = self._cache.get(key)
+        if rows is not None:
+            self._cache.move_to_end(key)
+            return rows
+        rows = self._parse_month(key)
+        self._cache[key] = rows
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return rows
+
+    def rows_for_range(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """Rows of every month touched by the inclusive date range (plus the margin)."""
+        if self._all is not None:
+            return self._all
+        rows: List[Dict[str, Any]] = []
+        for key in months_between(start - MARGIN, end + MARGIN):
+            if key in self.months:
+                rows.extend(self.rows_for_month(key))
+        return rows
+
+
+def set_timezone(name: str) -> None:
+    os.environ["TZ"] = name
+    time.tzset()
+
+
+def check(filename: str, timezones: Tuple[str, ...] = CHECK_TIMEZONES) -> List[str]:
+    """
+    calc_range of every month through a MonthLoader and over read_data's
+    rows, in several host time zones; returns the months that differ.
+    """
+    original = os.environ.get("TZ")
+    mismatches = []
+    try:
+        for tz in timezones:
+            set_timezone(tz)
+            rows = read_data(filename)
+            loader = MonthLoader(filename, cache_size=2)
+            years = sorted({row["ts"].year for row in rows})
+            for year in years:
+                for month in range(1, 13):
+                    start = datetime(year, month, 1)
+                    end = datetime(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+                    expected = calc_range(rows, start, end)
+                    actual = calc_range(loader.rows_for_range(start, end), start, end)
+                    if actual != expected:
+                        mismatches.append(f"{tz} {month:02d}.{year}: {actual['cons']:.2f} kWh "
+                                          f"from the index, {expected['cons']:.2f} kWh from read_data")
+    finally:
+        if original is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = original
+        time.tzset()
+    return mismatches
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Month index of the hourly CSV")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("--check", action="store_true",
+                        help=f"compare the monthly totals with read_data in {', '.join(CHECK_TIMEZONES)}")
+    args = parser.parse_args(argv)
+
+    delim, spans, rows, unindexed = load_index(args.csv_file)
+    print(f"{len(spans)} months, {rows} data lines, {unindexed} lines without a YYYY-MM prefix")
+    if args.check:
+        mismatches = check(args.csv_file)
+        for line in mismatches:
+            print(f"MISMATCH {line}")
+        print("FAILED" if mismatches else "OK")
+        sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Percentiles and peak hours of the hourly consumption, per month and year.
+
+PeakSummary is fed by read_data (read_data(path, summary=summary)) in the
+same pass as parsing, so no value array is kept or sorted:
+
+  QuantileSketch  log-spaced histogram bins (relative accuracy 0.5 %):
+                  p50 / p95 / p99 are read from the bin counts
+  TopHours        bounded min-heap of the N highest hours
+
+Both are mergeable.  A fleet directory is summarized per site in a process
+pool and the site summaries are merged; the fleet percentiles are those
+of all site-hours, and the fleet peaks are the highest site-hours.
+
+Percentiles use the lower nearest rank: p(q) = sorted(values)[int(q * (n - 1))].
+--check compares the sketch and heap with that exact computation.
+
+Usage:
+  python peaks.py [CSV_FILE] [--top N]
+  python peaks.py --fleet DIRECTORY [--top N] [--workers N]
+  python peaks.py [CSV_FILE | --fleet DIRECTORY] --check
+"""
+import argparse
+import heapq
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from task_f import CSV_FILE, format_number, read_data
+
+ACCURACY = 0.005  # relative error of the sketch's percentiles
+TOP_N = 5
+QUANTILES = (0.50, 0.95, 0.99)
+ZERO = 1e-9  # |values| at or below this count as 0
+
+# (consumption, local time, site)
+Peak = Tuple[float, datetime, str]
+
+
+class QuantileSketch:
+    """
+    Histogram with bins (gamma^(i-1), gamma^i] for positive values and the
+    mirrored bins for negative ones.  Any value of a bin is reported as the
+    bin's midpoint 2 * gamma^i / (gamma + 1), which is within `accuracy` of
+    it relatively, for any range of values and a few hundred bins.
+    """
+
+    def __init__(self, accuracy: float = ACCURACY):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, x: float) -> int:
+        return math.ceil(math.log(x) / self._log_gamma)
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        if x > ZERO:
+            i = self._index(x)
+            self.positive[i] = self.positive.get(i, 0) + 1
+        elif x < -ZERO:
+            i = self._index(-x)
+            self.negative[i] = self.negative.get(i, 0) + 1
+        else:
+            self.zeros += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.gamma != self.gamma:
+            raise ValueError("sketches with different accuracy cannot be merged")
+        for bins, other_bins in ((self.positive, other.positive), (self.negative, other.negative)):
+            for i, n in other_bins.items():
+                bins[i] = bins.get(i, 0) + n
+        self.zeros += other.zeros
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _bins(self) -> Iterable[Tuple[float, int]]:
+        """(value, count) in ascending order."""
+        midpoint = lambda i: 2 * self.gamma ** i / (self.gamma + 1)
+        for i in sorted(self.negative, reverse=True):
+            yield -midpoint(i), self.negative[i]
+        if self.zeros:
+            yield 0.0, self.zeros
+        for i in sorted(self.positive):
+            yield midpoint(i), self.positive[i]
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = int(q * (self.count - 1))
+        seen = 0
+        for value, n in self._bins():
+            seen += n
+            if seen > rank:
+                # the exact extremes are known; keep estimates inside them
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class TopHours:
+    """The N highest hours seen, in a min-heap of at most N entries."""
+
+    def __init__(self, n: int = TOP_N):
+        if n < 1:
+            raise ValueError(f"need at least one top hour, got {n}")
+        self.n = n
+        self.heap: List[Peak] = []
+
+    def push(self, peak: Peak) -> None:
+        if len(self.heap) < self.n:
+            heapq.heappush(self.heap, peak)
+        elif peak > self.heap[0]:
+            heapq.heapreplace(self.heap, peak)
+
+    def merge(self, other: "TopHours") -> "TopHours":
+        for peak in other.heap:
+            self.push(peak)
+        return self
+
+    def top(self) -> List[Peak]:
+        return sorted(self.heap, reverse=True)
+
+
+class PeakSummary:
+    """read_data summary: a sketch and top hours per (year, month) and (year,)."""
+
+    def __init__(self, site: str = "", top: int = TOP_N, accuracy: float = ACCURACY):
+        self.site = site
+        self.top = top
+        self.accuracy = accuracy
+        self.periods: Dict[Tuple[int, ...], Tuple[QuantileSketch, TopHours]] = {}
+        self._month: Optional[Tuple[int, int]] = None
+        self._current: List[Tuple[QuantileSketch, TopHours]] = []
+
+    def _period(self, key: Tuple[int, ...]) -> Tuple[QuantileSketch, TopHours]:
+        entry = self.periods.get(key)
+        if entry is None:
+            entry = self.periods[key] = (QuantileSketch(self.accuracy), TopHours(self.top))
+        return entry
+
+    def add(self, row: Dict[str, Any]) -> None:
+        ts = row["ts"]
+        # rows come in time order: look the month and year up only when the month changes
+        if self._month != (ts.year, ts.month):
+            self._month = (ts.year, ts.month)
+            self._current = [self._period(self._month), self._period((ts.year,))]
+        peak = (row["cons"], ts, self.site)
+        for sketch, top in self._current:
+            sketch.add(row["cons"])
+            top.push(peak)
+
+    def merge(self, other: "PeakSummary") -> "PeakSummary":
+        for key, (sketch, top) in other.periods.items():
+            mine = self._period(key)
+            mine[0].merge(sketch)
+            mine[1].merge(top)
+        self._month = None  # the cached current entries may have been created now
+        return self
+
+    def report(self, title: str) -> List[str]:
+        lines = ["=====================================================", title, ""]
+        labels = "".join(f"{f'p{round(q * 100)}':>10}" for q in QUANTILES)
+        lines.append(f"{'Period':<10}{'Hours':>8}{labels}   Top {self.top} hours (kWh)")
+        months = sorted(k for k in self.periods if len(k) == 2)
+        years = sorted(k for k in self.periods if len(k) == 1)
+        for key in months + years:
+            sketch, top = self.periods[key]
+            period = f"{key[1]:02d}.{key[0]}" if len(key) == 2 else str(key[0])
+            percentiles = "".join(f"{format_number(sketch.quantile(q)):>10}" for q in QUANTILES)
+            peaks = "; ".join(
+                f"{ts.strftime('%d.%m. %H:%M')}{f' {site}' if site and not self.site else ''} {format_number(value)}"
+                for value, ts, site in top.top()
+            )
+            lines.append(f"{period:<10}{sketch.count:>8}{percentiles}   {peaks}")
+        lines.append("")
+        return lines
+
+
+def positive_int(text: str) -> int:
+    """argparse type: an integer >= 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def site_summary(path: str, top: int = TOP_N) -> PeakSummary:
+    """Worker: one pass over one meter file."""
+    summary = PeakSummary(os.path.splitext(os.path.basename(path))[0], top)
+    read_data(path, summary=summary)
+    return summary
+
+
+def meter_files(directory: str) -> List[str]:
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith(".csv"))
+
+
+def fleet_summaries(paths: List[str], top: int = TOP_N,
+                    workers: Optional[int] = None) -> Tuple[List[PeakSummary], PeakSummary]:
+    """Per-site summaries (process pool) and their merge."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        sites = list(pool.map(site_summary, paths, [top] * len(paths)))
+    fleet = PeakSummary(top=top)
+    for summary in sites:
+        fleet.merge(summary)
+    return sites, fleet
+
+
+def exact_check(paths: List[str], summary: PeakSummary) -> List[str]:
+    """
+    Recomputes every period exactly (sorted values) and returns the
+    percentiles and top hours that disagree with the summary beyond its
+    accuracy (empty when all agree).
+    """
+    values: Dict[Tuple[int, ...], List[float]] = {}
+    for path in paths:
+        for row in read_data(path):
+            ts = row["ts"]
+            values.setdefault((ts.year, ts.month), []).append(row["cons"])
+            values.setdefault((ts.year,), []).append(row["cons"])
+
+    errors = []
+    worst = 0.0
+    for key, exact_values in sorted(values.items()):
+        exact_values.sort()
+        sketch, top = summary.periods[key]
+        if sketch.count != len(exact_values):
+            errors.append(f"{key}: {sketch.count} hours in the sketch, {len(exact_values)} exact")
+        for q in QUANTILES:
+            exact = exact_values[int(q * (len(exact_values) - 1))]
+            estimate = sketch.quantile(q)
+            error = abs(estimate - exact)
+            if exact:
+                worst = max(worst, error / abs(exact))
+            if error > summary.accuracy * abs(exact) * (1 + 1e-9) + ZERO:
+                errors.append(f"{key} p{round(q * 100)}: {estimate} estimated, {exact} exact")
+        exact_top = exact_values[::-1][:summary.top]
+        if [value for value, _, _ in top.top()] != exact_top:
+            errors.append(f"{key} top {summary.top}: {[p[0] for p in top.top()]} != {exact_top}")
+    print(f"Checked {len(values)} periods: largest relative percentile error "
+          f"{worst:.3%} (allowed {summary.accuracy:.1%})")
+    return errors
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Percentiles and peak hours of the hourly consumption")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("--fleet", metavar="DIRECTORY", help="all meter files of a directory, per site and merged")
+    parser.add_argument("--top", type=positive_int, default=TOP_N, help="peak hours per period")
+    parser.add_argument("--workers", type=positive_int, default=None)
+    parser.add_argument("--check", action="store_true", help="compare with the exact percentiles and peaks")
+    args = parser.parse_args(argv)
+
+    if args.fleet:
+        paths = meter_files(args.fleet)
+        if not paths:
+            print(f"No meter files found in {args.fleet}.")
+            return
+        sites, summary = fleet_summaries(paths, args.top, args.workers)
+        lines = []
+        for site in sites:
+            lines.extend(site.report(f"Site: {site.site}"))
+        lines.extend(summary.report(f"Fleet ({len(sites)} sites)"))
+    else:
+        paths = [args.csv_file]
+        summary = PeakSummary(top=args.top)
+        read_data(args.csv_file, summary=summary)
+        lines = summary.report(f"Hourly consumption: {args.csv_file}")
+
+    if args.check:
+        errors = exact_check(paths, summary)
+        for line in errors:
+            print(f"MISMATCH {line}")
+        print("FAILED" if errors else "OK")
+        sys.exit(1 if errors else 0)
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
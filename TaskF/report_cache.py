@@ -0,0 +1,55 @@
+"""
+Bounded LRU cache for finished report lines.
+
+Keys are (report type, range, data fingerprint), so a report is rebuilt
+only when it was never asked for or when the underlying data changed.
+Hit and miss counters are kept for monitoring.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+def data_fingerprint(data: Any) -> Hashable:
+    """Fingerprint of a data source: file state for a loader, length for a row list."""
+    fingerprint = getattr(data, "fingerprint", None)
+    if fingerprint is not None:
+        return fingerprint
+    return (id(data), len(data))
+
+
+class ReportCache:
+    """LRU cache of report lines with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, List[str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, kind: str, report_range: Tuple, data: Any,
+                     build: Callable[[], List[str]]) -> List[str]:
+        """Returns cached lines for the key, or builds and stores them."""
+        key = (kind, report_range, data_fingerprint(data))
+        lines = self._entries.get(key)
+        if lines is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return lines
+        self.misses += 1
+        lines = build()
+        if lines:
+            self._entries[key] = lines
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return lines
+
+    def invalidate(self) -> None:
+        """Drops all entries (data was reloaded or appended to)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
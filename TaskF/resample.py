@@ -0,0 +1,212 @@
+"""
+Resampling of the read_data series between 15 min, 1 h, 1 d, 1 w and 1 mo.
+
+Downsampling sums consumption and production (kWh) and averages the
+temperature, weighted by the number of raw samples in each bucket.  All
+resolutions at or above the native one (detected from the row spacing)
+are filled in one streaming pass over the rows.  Upsampling below the
+native resolution splits every kWh bucket evenly over its sub-intervals
+and repeats the temperature.
+
+Buckets start at local (naive) times like the reports: weeks on Monday,
+months on the 1st.  The repeated hour at the end of DST falls into the
+same hourly bucket as the first one, so that bucket holds two hours.
+
+Each resolution is computed once and cached; repeated queries (also
+range totals) read the cached buckets and never touch the raw rows.
+Range totals need a range of whole buckets at the chosen resolution.
+
+Usage:
+  python resample.py [CSV_FILE] --to 1d [-o resampled.csv]
+"""
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from report_cache import data_fingerprint
+from task_f import CSV_FILE, format_number, read_data
+
+RESOLUTIONS = ["15min", "1h", "1d", "1w", "1mo"]  # fine -> coarse
+QUARTER = timedelta(minutes=15)
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+WEEK = timedelta(days=7)
+
+
+def floor_15min(ts: datetime) -> datetime:
+    return ts.replace(minute=ts.minute - ts.minute % 15, second=0, microsecond=0)
+
+
+def floor_hour(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(ts: datetime) -> datetime:
+    return datetime(ts.year, ts.month, ts.day)
+
+
+def floor_week(ts: datetime) -> datetime:
+    return floor_day(ts) - timedelta(days=ts.weekday())
+
+
+def floor_month(ts: datetime) -> datetime:
+    return datetime(ts.year, ts.month, 1)
+
+
+def next_month(start: datetime) -> datetime:
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+FLOOR: Dict[str, Callable[[datetime], datetime]] = {
+    "15min": floor_15min, "1h": floor_hour, "1d": floor_day, "1w": floor_week, "1mo": floor_month,
+}
+NEXT: Dict[str, Callable[[datetime], datetime]] = {
+    "15min": lambda s: s + QUARTER, "1h": lambda s: s + HOUR, "1d": lambda s: s + DAY,
+    "1w": lambda s: s + WEEK, "1mo": next_month,
+}
+
+
+def detect_resolution(rows: List[Dict[str, Any]], sample: int = 200) -> str:
+    """Native resolution from the smallest positive step between rows."""
+    steps = [b["ts"] - a["ts"] for a, b in zip(rows[:sample], rows[1:sample + 1])]
+    step = min((s for s in steps if s > timedelta(0)), default=HOUR)
+    return "15min" if step <= QUARTER else "1h"
+
+
+def downsample(rows: Iterable[Dict[str, Any]], resolutions: List[str]) -> Dict[str, Dict[datetime, List[float]]]:
+    """
+    One pass over the rows; for every resolution {bucket start: [cons, prod,
+    temp sum, samples]}.  The current bucket of each resolution is remembered,
+    so rows in time order need no floor or dict lookup until a bucket ends.
+    """
+    buckets: Dict[str, Dict[datetime, List[float]]] = {res: {} for res in resolutions}
+    current = [[res, FLOOR[res], NEXT[res], buckets[res], None, None, None] for res in resolutions]
+    for row in rows:
+        ts = row["ts"]
+        for c in current:
+            if c[4] is None or not c[4] <= ts < c[5]:
+                start = c[1](ts)
+                c[4], c[5] = start, c[2](start)
+                c[6] = c[3].get(start)
+                if c[6] is None:
+                    c[6] = c[3][start] = [0.0, 0.0, 0.0, 0]
+            bucket = c[6]
+            bucket[0] += row["cons"]
+            bucket[1] += row["prod"]
+            bucket[2] += row["temp"]
+            bucket[3] += 1
+    return buckets
+
+
+def upsample(buckets: Dict[datetime, List[float]], source: str, target: str) -> Dict[datetime, List[float]]:
+    """Splits each bucket evenly into the finer target buckets."""
+    step = NEXT[target]
+    result: Dict[datetime, List[float]] = {}
+    for start, (cons, prod, temp_sum, samples) in buckets.items():
+        end = NEXT[source](start)
+        starts = []
+        t = start
+        while t < end:
+            starts.append(t)
+            t = step(t)
+        k = len(starts)
+        for t in starts:
+            result[t] = [cons / k, prod / k, temp_sum / k, samples / k]
+    return result
+
+
+def to_rows(buckets: Dict[datetime, List[float]]) -> List[Dict[str, Any]]:
+    return [
+        {"ts": start, "cons": b[0], "prod": b[1], "temp": b[2] / b[3] if b[3] else 0.0, "samples": b[3]}
+        for start, b in sorted(buckets.items())
+    ]
+
+
+class Resampler:
+    """Resampled views of one row list, cached per resolution."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.native = detect_resolution(rows)
+        self.computed_passes = 0
+        self._fingerprint: Optional[Hashable] = None
+        self._buckets: Dict[str, Dict[datetime, List[float]]] = {}
+        self._series: Dict[str, List[Dict[str, Any]]] = {}
+
+    def invalidate(self) -> None:
+        self._buckets.clear()
+        self._series.clear()
+
+    def _ensure(self) -> None:
+        fingerprint = data_fingerprint(self.rows)
+        if fingerprint != self._fingerprint:
+            self.invalidate()
+            self._fingerprint = fingerprint
+        if not self._buckets:
+            coarse = RESOLUTIONS[RESOLUTIONS.index(self.native):]
+            self._buckets = downsample(self.rows, coarse)
+            self.computed_passes += 1
+
+    def buckets(self, resolution: str) -> Dict[datetime, List[float]]:
+        """{bucket start: [cons, prod, temp sum, samples]} at a resolution."""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"unknown resolution {resolution!r}, use one of {', '.join(RESOLUTIONS)}")
+        self._ensure()
+        if resolution not in self._buckets:
+            self._buckets[resolution] = upsample(self._buckets[self.native], self.native, resolution)
+        return self._buckets[resolution]
+
+    def series(self, resolution: str) -> List[Dict[str, Any]]:
+        """Rows like read_data's ("ts", "cons", "prod", "temp") plus "samples", in time order."""
+        self._ensure()
+        if resolution not in self._series:
+            self._series[resolution] = to_rows(self.buckets(resolution))
+        return self._series[resolution]
+
+    def totals(self, start: datetime, end: datetime, resolution: str = "1d") -> Dict[str, float]:
+        """
+        calc_range-style totals from the cached buckets starting within
+        start..end (inclusive day).  The range must be made of whole buckets
+        (e.g. Monday..Sunday for 1w, 1st..last day for 1mo); a partial bucket
+        would be counted whole or not at all, so it raises ValueError.
+        """
+        buckets = self.buckets(resolution)
+        floor = FLOOR[resolution]
+        if floor(start) != start or NEXT[resolution](floor(end)) > floor_day(end) + DAY:
+            raise ValueError(f"{start:%d.%m.%Y %H:%M}..{end:%d.%m.%Y} is not made of whole {resolution} buckets, "
+                             f"use a finer resolution")
+        end = end.replace(hour=23, minute=59, second=59)
+        cons = prod = temp_sum = samples = 0.0
+        for bucket_start, b in buckets.items():
+            if start <= bucket_start <= end:
+                cons += b[0]
+                prod += b[1]
+                temp_sum += b[2]
+                samples += b[3]
+        return {"cons": cons, "prod": prod, "avg_temp": temp_sum / samples if samples else 0.0}
+
+
+def write_series_csv(series: List[Dict[str, Any]], filename: str) -> None:
+    """Writes a resampled series in the input CSV style (';', comma decimals)."""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("Time;Consumption kWh;Production kWh;Average temperature\n")
+        for r in series:
+            f.write(f"{r['ts'].isoformat()};{format_number(r['cons'])};{format_number(r['prod'])};"
+                    f"{format_number(r['temp'])}\n")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Resample the hourly energy series")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("--to", choices=RESOLUTIONS, default="1d")
+    parser.add_argument("-o", "--output", default="resampled.csv")
+    args = parser.parse_args(argv)
+
+    resampler = Resampler(read_data(args.csv_file))
+    series = resampler.series(args.to)
+    write_series_csv(series, args.output)
+    print(f"{len(series)} {args.to} rows (from {resampler.native} data) written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Streaming rolling-window statistics for the hourly energy series.
+
+Each window keeps its rows in a deque together with a running sum, so
+adding an hour and dropping the hours that fell out of the window costs
+O(1) amortized per row.  Peak detection uses a monotonic deque (sliding
+window maximum), also O(1) amortized.
+
+The running sums are kept in integer thousandths (Wh for kWh), so adding
+and removing the same values returns exactly to 0 instead of drifting to
+-0,00.  Windows are keyed on the UTC instant, so a 24 h window holds 24
+rows also across the DST changes.
+
+Computed per hour:
+  - rolling 24 h and 7 d consumption and production sums
+  - rolling 24 h mean temperature
+  - the peak consumption hour of the last 24 h, and whether the current
+    hour is that peak
+
+Usage:
+  python rolling.py [CSV_FILE] [-o rolling.csv]
+"""
+import argparse
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from task_f import CSV_FILE, format_number, read_data
+
+ROLLING_FILE = "rolling.csv"
+DAY = timedelta(hours=24)
+WEEK = timedelta(days=7)
+
+
+class RollingSum:
+    """Sum of the values whose timestamp is within the trailing window."""
+
+    def __init__(self, window: timedelta):
+        self.window = window
+        # (timestamp, value in thousandths)
+        self.items: Deque[Tuple[datetime, int]] = deque()
+        self.total = 0
+
+    def push(self, ts: datetime, value: float) -> float:
+        milli = round(value * 1000)
+        self.items.append((ts, milli))
+        self.total += milli
+        limit = ts - self.window
+        while self.items[0][0] <= limit:
+            self.total -= self.items.popleft()[1]
+        return self.total / 1000
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class RollingMean(RollingSum):
+    """Mean of the values within the trailing window."""
+
+    def push(self, ts: datetime, value: float) -> float:
+        total = super().push(ts, value)
+        return total / len(self.items)
+
+
+class RollingMax:
+    """Largest value within the trailing window (monotonic deque)."""
+
+    def __init__(self, window: timedelta):
+        self.window = window
+        # (timestamp, value, label)
+        self.items: Deque[Tuple[datetime, float, Any]] = deque()
+
+    def push(self, ts: datetime, value: float, label: Any = None) -> Tuple[datetime, float, Any]:
+        """Adds a value; returns the (timestamp, value, label) of the window's maximum."""
+        while self.items and self.items[-1][1] <= value:
+            self.items.pop()
+        self.items.append((ts, value, label))
+        limit = ts - self.window
+        while self.items[0][0] <= limit:
+            self.items.popleft()
+        return self.items[0]
+
+
+class RollingEngine:
+    """Feeds hourly rows through all rolling windows."""
+
+    def __init__(self):
+        self.cons_24h = RollingSum(DAY)
+        self.prod_24h = RollingSum(DAY)
+        self.cons_7d = RollingSum(WEEK)
+        self.prod_7d = RollingSum(WEEK)
+        self.temp_24h = RollingMean(DAY)
+        self.peak_24h = RollingMax(DAY)
+
+    def update(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds one hour (rows must arrive in UTC order) and returns its
+        statistics; the windows use "utc", the output times are local "ts".
+        """
+        utc = row["utc"]
+        peak_utc, peak, peak_ts = self.peak_24h.push(utc, row["cons"], row["ts"])
+        return {
+            "ts": row["ts"],
+            "cons_24h": self.cons_24h.push(utc, row["cons"]),
+            "prod_24h": self.prod_24h.push(utc, row["prod"]),
+            "cons_7d": self.cons_7d.push(utc, row["cons"]),
+            "prod_7d": self.prod_7d.push(utc, row["prod"]),
+            "temp_24h": self.temp_24h.push(utc, row["temp"]),
+            "peak_24h": peak,
+            "peak_24h_ts": peak_ts,
+            "is_peak": peak_utc == utc,
+        }
+
+    def run(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for row in rows:
+            yield self.update(row)
+
+
+COLUMNS = ["Time", "Consumption 24h kWh", "Production 24h kWh", "Consumption 7d kWh",
+           "Production 7d kWh", "Temperature 24h mean", "Peak 24h kWh", "Peak 24h time", "Peak hour"]
+
+
+def write_rolling_csv(stats: Iterable[Dict[str, Any]], filename: str = ROLLING_FILE) -> int:
+    """Writes the rolling statistics in the input CSV style (';', comma decimals)."""
+    count = 0
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(";".join(COLUMNS) + "\n")
+        for s in stats:
+            f.write(";".join([
+                s["ts"].isoformat(),
+                format_number(s["cons_24h"]),
+                format_number(s["prod_24h"]),
+                format_number(s["cons_7d"]),
+                format_number(s["prod_7d"]),
+                format_number(s["temp_24h"]),
+                f"{s['peak_24h']:.3f}".replace(".", ","),
+                s["peak_24h_ts"].isoformat(),
+                "1" if s["is_peak"] else "0",
+            ]) + "\n")
+            count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rolling 24 h / 7 d statistics")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("-o", "--output", default=ROLLING_FILE)
+    args = parser.parse_args(argv)
+
+    rows = sorted(read_data(args.csv_file), key=lambda r: r["utc"])
+    count = write_rolling_csv(RollingEngine().run(rows), args.output)
+    print(f"{count} rows written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+Time-of-use / spot price cost engine for the hourly series.
+
+Joins the hourly consumption and production of read_data with an hourly
+price series (c/kWh) and sums cost and revenue (€) per day, month and
+year.  Rows are joined on the UTC hour, so DST changes line up.
+
+The data is first turned into columns (period index, consumption,
+production, price).  With NumPy the join is vectorized too: the price
+hours are sorted once and every meter hour is looked up with
+np.searchsorted, the periods are grouped with np.unique and summed with
+np.bincount; only reading the values out of the row dicts is a Python
+loop (np.fromiter).  Without NumPy the join is a dict lookup per row and
+the columns are summed in pure Python.
+
+Price CSV (same style as the meter data, ';' and comma decimals):
+  Time;Price c/kWh
+  2025-01-01T00:00:00.000+02:00;5,21
+
+Usage:
+  python tariff.py PRICES_CSV [CSV_FILE] [--period day|month|year] [--sell-prices CSV]
+  python tariff.py PRICES_CSV [CSV_FILE] [--period ...] --check
+"""
+import argparse
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from task_f import (CSV_FILE, detect_delimiter, format_number, parse_datetime_raw, read_data,
+                    split_fields, to_utc)
+
+try:
+    import numpy as np
+except ImportError:  # optional
+    np = None
+
+PERIOD_KEYS = {
+    "day": lambda ts: (ts.year, ts.month, ts.day),
+    "month": lambda ts: (ts.year, ts.month),
+    "year": lambda ts: (ts.year,),
+}
+
+# period -> (int code of a local time, period key of a code), for np.unique
+PERIOD_CODES = {
+    "day": (lambda ts: ts.year * 10000 + ts.month * 100 + ts.day, lambda c: (c // 10000, c // 100 % 100, c % 100)),
+    "month": (lambda ts: ts.year * 100 + ts.month, lambda c: (c // 100, c % 100)),
+    "year": (lambda ts: ts.year, lambda c: (c,)),
+}
+
+
+def hour_key(utc: datetime) -> int:
+    """Hours since the epoch: the join key between meter rows and prices."""
+    return int(utc.timestamp()) // 3600
+
+
+def load_prices(filename: str) -> Dict[int, float]:
+    """
+    Reads an hourly price CSV into {hour key: c/kWh}.
+    Blank and malformed rows are skipped, as in read_data; a repeated naive
+    hour (end of DST) is the second instant.
+    """
+    prices: Dict[int, float] = {}
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline()
+        previous = None
+        for r in split_fields(f, detect_delimiter(header), header):
+            if len(r) < 2 or not r[0].strip():
+                continue
+            try:
+                raw = parse_datetime_raw(r[0])
+                price = float(r[1])
+            except ValueError:
+                continue
+            if raw.tzinfo is None and raw == previous:
+                raw = raw.replace(fold=1)
+            previous = raw
+            prices[hour_key(to_utc(raw))] = price
+    return prices
+
+
+def build_columns(rows: List[Dict[str, Any]], buy: Dict[int, float], sell: Dict[int, float],
+                  period: str) -> Tuple[List[Tuple], List[int], List[float], List[float], List[float], List[float], int]:
+    """
+    Joins rows with prices. Returns (period keys, period index per row,
+    consumption, production, buy price, sell price, hours without a price).
+    """
+    key_of = PERIOD_KEYS[period]
+    periods: Dict[Tuple, int] = {}
+    index, cons, prod, buy_price, sell_price = [], [], [], [], []
+    missing = 0
+    for r in rows:
+        h = hour_key(r["utc"])
+        price = buy.get(h)
+        if price is None:
+            missing += 1
+            continue
+        key = key_of(r["ts"])
+        index.append(periods.setdefault(key, len(periods)))
+        cons.append(r["cons"])
+        prod.append(r["prod"])
+        buy_price.append(price)
+        sell_price.append(sell.get(h, price))
+    return list(periods), index, cons, prod, buy_price, sell_price, missing
+
+
+def join_prices(hours, prices: Dict[int, float]):
+    """
+    NumPy: (price of every hour key, whether it has one).  The price hours
+    are sorted once and all hours are looked up with np.searchsorted.
+    """
+    if not prices:
+        return np.zeros(len(hours)), np.zeros(len(hours), dtype=bool)
+    price_hours = np.fromiter(prices.keys(), np.int64, len(prices))
+    values = np.fromiter(prices.values(), np.float64, len(prices))
+    order = np.argsort(price_hours)
+    price_hours, values = price_hours[order], values[order]
+    pos = np.minimum(np.searchsorted(price_hours, hours), len(price_hours) - 1)
+    return values[pos], price_hours[pos] == hours
+
+
+def build_columns_numpy(rows: List[Dict[str, Any]], buy: Dict[int, float], sell: Dict[int, float],
+                        period: str) -> Tuple[List[Tuple], Any, Any, Any, Any, Any, int]:
+    """build_columns with NumPy arrays and a vectorized join (same result)."""
+    n = len(rows)
+    # int() of the timestamp truncates, like hour_key
+    hours = np.fromiter((r["utc"].timestamp() for r in rows), np.float64, n).astype(np.int64) // 3600
+    code_of, key_of = PERIOD_CODES[period]
+    codes = np.fromiter((code_of(r["ts"]) for r in rows), np.int64, n)
+    cons = np.fromiter((r["cons"] for r in rows), np.float64, n)
+    prod = np.fromiter((r["prod"] for r in rows), np.float64, n)
+    buy_price, priced = join_prices(hours, buy)
+    sell_price, sold = join_prices(hours, sell)
+    sell_price = np.where(sold, sell_price, buy_price)
+    period_codes, index = np.unique(codes[priced], return_inverse=True)
+    keys = [key_of(int(c)) for c in period_codes]
+    missing = n - int(priced.sum())
+    return keys, index, cons[priced], prod[priced], buy_price[priced], sell_price[priced], missing
+
+
+def sum_costs(index, cons, prod, buy_price, sell_price, count: int,
+              vectorized: bool = True) -> List[List[float]]:
+    """
+    Per period [consumption kWh, cost €, production kWh, revenue €].
+    The columns are lists (build_columns) or arrays (build_columns_numpy);
+    vectorized=False forces the pure-Python loop (used by --check).
+    """
+    if vectorized and np is not None and len(index):
+        idx = np.asarray(index)
+        c = np.asarray(cons)
+        p = np.asarray(prod)
+        columns = [
+            np.bincount(idx, weights=c, minlength=count),
+            np.bincount(idx, weights=c * np.asarray(buy_price) / 100, minlength=count),
+            np.bincount(idx, weights=p, minlength=count),
+            np.bincount(idx, weights=p * np.asarray(sell_price) / 100, minlength=count),
+        ]
+        return [[float(col[i]) for col in columns] for i in range(count)]
+
+    totals = [[0.0, 0.0, 0.0, 0.0] for _ in range(count)]
+    for i, c, p, bp, sp in zip(index, cons, prod, buy_price, sell_price):
+        t = totals[i]
+        t[0] += c
+        t[1] += c * bp / 100
+        t[2] += p
+        t[3] += p * sp / 100
+    return totals
+
+
+def costs(rows: List[Dict[str, Any]], buy: Dict[int, float], sell: Optional[Dict[int, float]] = None,
+          period: str = "month") -> Tuple[Dict[Tuple, List[float]], int]:
+    """
+    Cost and revenue per period.
+
+    Returns:
+        ({period key: [consumption, cost, production, revenue]}, hours without a price)
+    """
+    build = build_columns if np is None else build_columns_numpy
+    keys, index, cons, prod, buy_price, sell_price, missing = build(rows, buy, sell or {}, period)
+    totals = sum_costs(index, cons, prod, buy_price, sell_price, len(keys))
+    return dict(zip(keys, totals)), missing
+
+
+def reference_costs(rows: List[Dict[str, Any]], buy: Dict[int, float], sell: Optional[Dict[int, float]] = None,
+                    period: str = "month") -> Dict[Tuple, List[float]]:
+    """The same sums row by row, without the columns: the reference of --check."""
+    key_of = PERIOD_KEYS[period]
+    sell = sell or {}
+    result: Dict[Tuple, List[float]] = {}
+    for r in rows:
+        h = hour_key(r["utc"])
+        if h not in buy:
+            continue
+        t = result.setdefault(key_of(r["ts"]), [0.0, 0.0, 0.0, 0.0])
+        t[0] += r["cons"]
+        t[1] += r["cons"] * buy[h] / 100
+        t[2] += r["prod"]
+        t[3] += r["prod"] * sell.get(h, buy[h]) / 100
+    return result
+
+
+def check_costs(rows: List[Dict[str, Any]], buy: Dict[int, float], sell: Optional[Dict[int, float]] = None,
+                period: str = "month") -> List[str]:
+    """
+    Compares the pure-Python and (if installed) NumPy join and sums with the
+    row-by-row reference. Returns the disagreeing values (empty when all agree).
+    """
+    reference = reference_costs(rows, buy, sell, period)
+    variants = [("python", build_columns, False)]
+    if np is not None:
+        variants.append(("numpy", build_columns_numpy, True))
+    errors = [] if reference else ["no hour of the meter data has a price"]
+    for name, build, vectorized in variants:
+        keys, index, cons, prod, buy_price, sell_price, missing = build(rows, buy, sell or {}, period)
+        if set(keys) != set(reference):
+            errors.append(f"{name} periods {sorted(keys)} != {sorted(reference)}")
+        if missing != sum(1 for r in rows if hour_key(r["utc"]) not in buy):
+            errors.append(f"{name}: {missing} hours without a price")
+        totals = sum_costs(index, cons, prod, buy_price, sell_price, len(keys), vectorized)
+        for key, values in zip(keys, totals):
+            expected = reference.get(key, [0.0] * 4)
+            for label, value, exact in zip(("consumption", "cost", "production", "revenue"), values, expected):
+                if abs(value - exact) > 1e-9 * max(1.0, abs(exact)):
+                    errors.append(f"{name} {format_period(key)} {label}: {value} != {exact}")
+    print(f"Checked {len(reference)} periods: {', '.join(name for name, _, _ in variants)}"
+          f"{'' if np is not None else ' (NumPy is not installed)'}")
+    return errors
+
+
+def format_period(key: Tuple) -> str:
+    if len(key) == 3:
+        return f"{key[2]:02d}.{key[1]:02d}.{key[0]}"
+    if len(key) == 2:
+        return f"{key[1]:02d}.{key[0]}"
+    return str(key[0])
+
+
+def cost_report(result: Dict[Tuple, List[float]], missing: int) -> List[str]:
+    lines = ["-----------------------------------------------------",
+             f"{'Period':<12}{'Cons. kWh':>12}{'Cost €':>10}{'Prod. kWh':>12}{'Revenue €':>11}"]
+    for key in sorted(result):
+        c, cost, p, revenue = result[key]
+        lines.append(f"{format_period(key):<12}{format_number(c):>12}{format_number(cost):>10}"
+                     f"{format_number(p):>12}{format_number(revenue):>11}")
+    if missing:
+        lines.append(f"({missing} hours without a price were left out)")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Energy cost and revenue per period")
+    parser.add_argument("prices")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    parser.add_argument("--period", choices=list(PERIOD_KEYS), default="month")
+    parser.add_argument("--sell-prices", help="separate price series for production")
+    parser.add_argument("--check", action="store_true",
+                        help="compare the NumPy and pure-Python sums with a row-by-row computation")
+    args = parser.parse_args(argv)
+
+    rows = read_data(args.csv_file)
+    buy = load_prices(args.prices)
+    sell = load_prices(args.sell_prices) if args.sell_prices else None
+    if args.check:
+        errors = check_costs(rows, buy, sell, args.period)
+        for line in errors:
+            print(f"MISMATCH {line}")
+        print("FAILED" if errors else "OK")
+        sys.exit(1 if errors else 0)
+    result, missing = costs(rows, buy, sell, args.period)
+    for line in cost_report(result, missing):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-import csv
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 CSV_FILE = "2025.csv"
 REPORT_FILE = "report.txt"
@@ -9,8 +9,8 @@ def format_number(value: float) -> str:
     """Two decimals, comma as decimal separator."""
     return f"{value:.2f}".replace(".", ",")
 
-def parse_timestamp(s: str) -> datetime:
-    """Parse ISO timestamps (ms + offset) or common formats; return naive datetime."""
+def parse_datetime_raw(s: str) -> datetime:
+    """Parse ISO timestamps (ms + offset) or common formats; keeps the offset if present."""
     s = s.strip()
     # try direct ISO (handles 2025-01-01T00:00:00.000+02:00)
     try:
@@ -37,6 +37,15 @@ def parse_timestamp(s: str) -> datetime:
 
     if ts is None:
         raise ValueError(f"Unknown date format: {s}")
+    return ts
+
+def to_utc(ts: datetime) -> datetime:
+    """Aware UTC datetime; naive timestamps are taken as local time."""
+    return ts.astimezone(timezone.utc)
+
+def parse_timestamp(s: str) -> datetime:
+    """Parse ISO timestamps (ms + offset) or common formats; return naive datetime."""
+    ts = parse_datetime_raw(s)
 
     # If timestamp has tzinfo, convert to local time and drop tzinfo (make naive)
     if ts.tzinfo is not None:
@@ -50,8 +59,60 @@ def detect_delimiter(sample: str) -> str:
         return ";"
     return ","
 
-def read_data(filename: str) -> List[Dict[str, Any]]:
-    """Reads CSV, convert comma decimals, return list of rows."""
+def parse_milli(text: str) -> int:
+    """
+    Fixed-point parse of a decimal number into thousandths, without floats:
+    '1,569' kWh -> 1569 Wh, '-4,5' -> -4500. Digits past the third decimal are dropped.
+    """
+    text = text.strip()
+    negative = text.startswith("-")
+    if negative or text.startswith("+"):
+        text = text[1:]
+    whole, _, frac = text.replace(",", ".").partition(".")
+    value = int(whole or "0") * 1000 + int((frac + "000")[:3])
+    return -value if negative else value
+
+def split_fields(lines: Iterable[str], delim: str, header: str = "") -> Iterator[List[str]]:
+    """
+    Splits data lines into fields with dot decimals.
+    Unquoted lines of ';'-separated files take the fast path: one replace
+    for the whole line (instead of one per field) and a plain split.
+    Quoted lines and comma-separated files go through csv.reader.
+    """
+    if delim == "," or '"' in header:
+        import csv  # only quoted or comma-separated files need it
+        for r in csv.reader(lines, delimiter=delim):
+            yield [x.replace(",", ".") for x in r]
+        return
+    for line in lines:
+        if '"' not in line:
+            yield line.replace(",", ".").split(delim)
+            continue
+        import csv  # a quoted field may hold the delimiter
+        for r in csv.reader([line], delimiter=delim):
+            yield [x.replace(",", ".") for x in r]
+
+def parse_row(r: List[str], previous: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Converts one split CSV row (time, consumption, production, temperature), dot decimals.
+    "utc" is the unambiguous instant, "ts" the naive local time used by the reports.
+    previous is the "ts" of the row before: a naive timestamp equal to it is
+    the repeated hour at the end of DST and gets fold=1 (the second instant).
+    """
+    raw = parse_datetime_raw(r[0])
+    if raw.tzinfo is None and raw == previous:
+        raw = raw.replace(fold=1)
+    utc = to_utc(raw)
+    ts = utc.astimezone().replace(tzinfo=None) if raw.tzinfo is not None else raw
+    return {"ts": ts, "utc": utc, "cons": float(r[1]), "prod": float(r[2]), "temp": float(r[3])}
+
+def read_data(filename: str, validator: Any = None, summary: Any = None) -> List[Dict[str, Any]]:
+    """
+    Reads CSV, convert comma decimals, return list of rows.
+    With a TimelineValidator, skipped rows and timeline problems are
+    recorded in the same pass; a summary (e.g. peaks.PeakSummary) gets
+    add(row) for every converted row.
+    """
     rows: List[Dict[str, Any]] = []
     try:
         with open(filename, "r", encoding="utf-8") as f:
@@ -59,25 +120,42 @@ def read_data(filename: str) -> List[Dict[str, Any]]:
             if not header:
                 return rows
             delim = detect_delimiter(header)
-            f.seek(0)
-            reader = csv.reader(f, delimiter=delim)
-            next(reader, None)  # skip header if present
-            for r in reader:
+            previous = None
+            for line_no, r in enumerate(split_fields(f, delim, header), start=2):
                 if not r or len(r) < 4:
+                    if validator is not None and any(x.strip() for x in r):
+                        validator.skip(line_no, "short row")
                     continue
                 try:
-                    ts = parse_timestamp(r[0])
-                    # numbers use comma as decimal separator -> replace before float
-                    cons = float(r[1].replace(",", "."))
-                    prod = float(r[2].replace(",", "."))
-                    temp = float(r[3].replace(",", "."))
-                    rows.append({"ts": ts, "cons": cons, "prod": prod, "temp": temp})
+                    row = parse_row(r, previous)
                 except Exception:
+                    if validator is not None:
+                        validator.skip(line_no, skip_reason(r))
                     continue
+                previous = row["ts"]
+                rows.append(row)
+                if validator is not None:
+                    validator.check(line_no, row["utc"])
+                if summary is not None:
+                    summary.add(row)
     except FileNotFoundError:
         return rows
     return rows
 
+def skip_reason(r: List[str]) -> str:
+    """Why a row could not be converted (only called for bad rows)."""
+    try:
+        parse_datetime_raw(r[0])
+    except ValueError:
+        return "bad timestamp"
+    return "bad number"
+
+def select_rows(data: Any, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """Rows for a range: all rows, or only the needed months from a MonthLoader."""
+    if hasattr(data, "rows_for_range"):
+        return data.rows_for_range(start, end)
+    return data
+
 def calc_range(data: List[Dict[str, Any]], start: datetime, end: datetime) -> Dict[str, float]:
     """Sums consumption, production and average temperature for inclusive range."""
     end = end.replace(hour=23, minute=59, second=59)
@@ -95,7 +173,26 @@ def calc_range(data: List[Dict[str, Any]], start: datetime, end: datetime) -> Di
     avg_temp = (temp_sum / count) if count else 0.0
     return {"cons": total_cons, "prod": total_prod, "avg_temp": avg_temp}
 
-def create_daily_report(data: List[Dict[str, Any]]) -> List[str]:
+def report_lines(title: str, stats: Dict[str, float]) -> List[str]:
+    """Builds the report lines shared by all report types."""
+    lines: List[str] = []
+    lines.append("-----------------------------------------------------")
+    lines.append(title)
+    lines.append(f"- Total consumption: {format_number(stats['cons'])} kWh")
+    lines.append(f"- Total production: {format_number(stats['prod'])} kWh")
+    lines.append(f"- Average temperature: {format_number(stats['avg_temp'])} °C")
+    return lines
+
+def build_report(data: Any, kind: str, start: datetime, end: datetime,
+                 title: str, cache: Any = None) -> List[str]:
+    """Computes report lines for a range, through the report cache when given."""
+    def build() -> List[str]:
+        return report_lines(title, calc_range(select_rows(data, start, end), start, end))
+    if cache is None:
+        return build()
+    return cache.get_or_build(kind, (start, end), data, build)
+
+def create_daily_report(data: Any, cache: Any = None) -> List[str]:
     """Builds daily report for a date range (input dd.mm.yyyy)."""
     s = input("Enter start date (dd.mm.yyyy): ").strip()
     e = input("Enter end date (dd.mm.yyyy): ").strip()
@@ -105,16 +202,10 @@ def create_daily_report(data: List[Dict[str, Any]]) -> List[str]:
     except ValueError:
         print("Invalid date format. Use dd.mm.yyyy.")
         return []
-    stats = calc_range(data, start, end)
-    lines: List[str] = []
-    lines.append("-----------------------------------------------------")
-    lines.append(f"Report for the period {start.strftime('%d.%m.%Y')}–{end.strftime('%d.%m.%Y')}")
-    lines.append(f"- Total consumption: {format_number(stats['cons'])} kWh")
-    lines.append(f"- Total production: {format_number(stats['prod'])} kWh")
-    lines.append(f"- Average temperature: {format_number(stats['avg_temp'])} °C")
-    return lines
+    title = f"Report for the period {start.strftime('%d.%m.%Y')}–{end.strftime('%d.%m.%Y')}"
+    return build_report(data, "daily", start, end, title, cache)
 
-def create_monthly_report(data: List[Dict[str, Any]]) -> List[str]:
+def create_monthly_report(data: Any, cache: Any = None) -> List[str]:
     """Builds monthly summary for chosen month (1-12)."""
     m = input("Enter month number (1–12): ").strip()
     try:
@@ -132,28 +223,14 @@ def create_monthly_report(data: List[Dict[str, Any]]) -> List[str]:
     else:
         next_month = datetime(year, month + 1, 1)
     end = next_month - timedelta(days=1)
-    stats = calc_range(data, start, end)
     month_name = start.strftime("%B")
-    lines: List[str] = []
-    lines.append("-----------------------------------------------------")
-    lines.append(f"Report for the month: {month_name}")
-    lines.append(f"- Total consumption: {format_number(stats['cons'])} kWh")
-    lines.append(f"- Total production: {format_number(stats['prod'])} kWh")
-    lines.append(f"- Average temperature: {format_number(stats['avg_temp'])} °C")
-    return lines
+    return build_report(data, "monthly", start, end, f"Report for the month: {month_name}", cache)
 
-def create_yearly_report(data: List[Dict[str, Any]]) -> List[str]:
+def create_yearly_report(data: Any, cache: Any = None) -> List[str]:
     """Builds full-year 2025 summary."""
     start = datetime(2025, 1, 1)
     end = datetime(2025, 12, 31)
-    stats = calc_range(data, start, end)
-    lines: List[str] = []
-    lines.append("-----------------------------------------------------")
-    lines.append("Report for the year: 2025")
-    lines.append(f"- Total consumption: {format_number(stats['cons'])} kWh")
-    lines.append(f"- Total production: {format_number(stats['prod'])} kWh")
-    lines.append(f"- Average temperature: {format_number(stats['avg_temp'])} °C")
-    return lines
+    return build_report(data, "yearly", start, end, "Report for the year: 2025", cache)
 
 def print_report_to_console(lines: List[str]) -> None:
     """Prints report lines to console."""
@@ -175,6 +252,11 @@ def write_report_to_file(lines: List[str]) -> None:
     except IOError as e:
         print(f"Error writing to file: {e}")
 
+def print_cache_stats(cache: Any) -> None:
+    """Prints report cache counters."""
+    stats = cache.stats()
+    print(f"Report cache: {stats['hits']} hits, {stats['misses']} misses")
+
 def show_main_menu() -> str:
     """Shows main menu and return choice."""
     print("\n--- Energy Report Menu ---")
@@ -194,22 +276,40 @@ def post_report_menu() -> str:
 
 def main() -> None:
     """Main: read data, loop menus, generate and save reports."""
+    if len(sys.argv) > 2 and sys.argv[1] == "--fleet":
+        # batch mode: per-site and fleet reports for a directory of meter files
+        from fleet_report import main as fleet_main
+        fleet_main(sys.argv[2:])
+        return
+    if "--watch" in sys.argv:
+        # keep report.txt up to date while rows are appended to the CSV
+        from watch import watch
+        watch()
+        return
+    from month_index import MonthLoader
+    from report_cache import ReportCache
     print(f"Reading data from {CSV_FILE}...")
-    data = read_data(CSV_FILE)
-    if not data:
+    # months are parsed on demand, only when a report needs them
+    data = MonthLoader(CSV_FILE)
+    if not len(data):
         print("No data loaded. Check 2025.csv.")
     else:
         print(f"Loaded {len(data)} rows.")
+    cache = ReportCache()
     while True:
         choice = show_main_menu()
+        # CSV reloaded or appended to -> cached reports are stale
+        if data.refresh():
+            cache.invalidate()
         report_lines: List[str] = []
         if choice == "1":
-            report_lines = create_daily_report(data)
+            report_lines = create_daily_report(data, cache)
         elif choice == "2":
-            report_lines = create_monthly_report(data)
+            report_lines = create_monthly_report(data, cache)
         elif choice == "3":
-            report_lines = create_yearly_report(data)
+            report_lines = create_yearly_report(data, cache)
         elif choice == "4":
+            print_cache_stats(cache)
             print("Exiting program.")
             break
         else:
@@ -229,6 +329,7 @@ def main() -> None:
             elif action == "2":
                 break
             elif action == "3":
+                print_cache_stats(cache)
                 print("Exiting program.")
                 return
             else:
@@ -0,0 +1,109 @@
+"""
+Timeline validation for the hourly CSV, run in the same pass as parsing.
+
+read_data(filename, validator) calls check() for every converted row and
+skip() for every row it had to drop.  All checks are O(1) per row on the
+UTC timestamps, so DST changes do not show up as duplicated or missing
+hours:
+
+  duplicates    the same instant seen more than once
+  out of order  an instant earlier than the row before it
+  missing hours hours between the first and last instant with no row
+  skipped rows  counted per reason, with the first line numbers
+
+Usage:
+  python validation.py [CSV_FILE]
+"""
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from task_f import CSV_FILE, read_data
+
+STEP = timedelta(hours=1)
+MAX_EXAMPLES = 5
+
+
+class TimelineValidator:
+    """Collects timeline problems and skipped rows while a file is parsed."""
+
+    def __init__(self, step: timedelta = STEP):
+        self.step = step
+        self.rows = 0
+        self.first: Optional[datetime] = None
+        self.last: Optional[datetime] = None
+        self.previous: Optional[datetime] = None
+        self.seen: Set[datetime] = set()
+        self.duplicates: List[Tuple[int, datetime]] = []
+        self.out_of_order: List[Tuple[int, datetime]] = []
+        self.gaps: List[Tuple[datetime, int]] = []  # (first missing instant, hours)
+        self.skipped: Dict[str, List[int]] = {}
+
+    def skip(self, line_no: int, reason: str) -> None:
+        self.skipped.setdefault(reason, []).append(line_no)
+
+    def check(self, line_no: int, utc: datetime) -> None:
+        self.rows += 1
+        if utc in self.seen:
+            self.duplicates.append((line_no, utc))
+        else:
+            self.seen.add(utc)
+        if self.previous is not None and utc < self.previous:
+            self.out_of_order.append((line_no, utc))
+        self.previous = utc
+        # gaps are measured from the latest instant so far, not the previous row
+        if self.last is not None and utc - self.last > self.step:
+            self.gaps.append((self.last + self.step, (utc - self.last) // self.step - 1))
+        if self.first is None or utc < self.first:
+            self.first = utc
+        if self.last is None or utc > self.last:
+            self.last = utc
+
+    @property
+    def missing_hours(self) -> int:
+        """Expected instants between first and last minus the distinct ones seen."""
+        if self.first is None:
+            return 0
+        return (self.last - self.first) // self.step + 1 - len(self.seen)
+
+    @property
+    def skipped_count(self) -> int:
+        return sum(len(lines) for lines in self.skipped.values())
+
+    def ok(self) -> bool:
+        return not (self.duplicates or self.out_of_order or self.missing_hours or self.skipped)
+
+    def report(self) -> List[str]:
+        """Printable summary."""
+        when = lambda utc: utc.strftime("%Y-%m-%d %H:%M UTC")
+        lines = [f"Rows: {self.rows}, skipped: {self.skipped_count}"]
+        if self.first is not None:
+            lines.append(f"Range: {when(self.first)} – {when(self.last)}")
+        lines.append(f"Missing hours: {self.missing_hours}")
+        for start, hours in self.gaps[:MAX_EXAMPLES]:
+            lines.append(f"  {hours} h from {when(start)}")
+        lines.append(f"Duplicates: {len(self.duplicates)}")
+        for line_no, utc in self.duplicates[:MAX_EXAMPLES]:
+            lines.append(f"  line {line_no}: {when(utc)}")
+        lines.append(f"Out of order: {len(self.out_of_order)}")
+        for line_no, utc in self.out_of_order[:MAX_EXAMPLES]:
+            lines.append(f"  line {line_no}: {when(utc)}")
+        for reason, line_numbers in sorted(self.skipped.items()):
+            shown = ", ".join(map(str, line_numbers[:MAX_EXAMPLES]))
+            lines.append(f"Skipped ({reason}): {len(line_numbers)} (lines {shown})")
+        return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Validate the hourly timeline of a CSV")
+    parser.add_argument("csv_file", nargs="?", default=CSV_FILE)
+    args = parser.parse_args(argv)
+
+    validator = TimelineValidator()
+    read_data(args.csv_file, validator)
+    for line in validator.report():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
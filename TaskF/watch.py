@@ -0,0 +1,114 @@
+"""
+Live mode for report.txt: python task_f.py --watch
+
+The CSV is polled; only rows appended since the last poll are parsed and
+added to running per-year totals.  Only the years touched by new rows are
+re-rendered, and report.txt (one yearly report per year in the data) is
+replaced atomically with a temp file + rename.
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+import _bootstrap  # noqa: F401
+from task_f import CSV_FILE, REPORT_FILE, detect_delimiter, parse_row, report_lines, split_fields
+from taskcore.tail import AppendReader, write_atomic
+
+POLL_INTERVAL = 0.2  # seconds
+
+
+class YearlyTotals:
+    """Running per-year sums [consumption, production, temperature sum, hours]."""
+
+    def __init__(self, path: str):
+        self.reader = AppendReader(path)
+        self.years: Dict[int, List[float]] = {}
+        self.sections: Dict[int, List[str]] = {}
+        self.tail = b""
+        self.previous = None  # ts of the last row, for the repeated DST hour
+
+    def _rows(self, lines: List[str], final: bool = True) -> List[Dict[str, Any]]:
+        """
+        Converted rows (bad ones skipped, as in read_data).  Only final
+        (complete) lines advance self.previous; a provisional line does not.
+        """
+        delim = detect_delimiter(self.reader.header)
+        previous = self.previous
+        rows = []
+        for r in split_fields(lines, delim, self.reader.header):
+            if len(r) < 4:
+                continue
+            try:
+                rows.append(parse_row(r, previous))
+            except Exception:
+                continue
+            previous = rows[-1]["ts"]
+        if final:
+            self.previous = previous
+        return rows
+
+    @staticmethod
+    def _add(years: Dict[int, List[float]], row: Dict[str, Any]) -> int:
+        bucket = years.setdefault(row["ts"].year, [0.0, 0.0, 0.0, 0])
+        bucket[0] += row["cons"]
+        bucket[1] += row["prod"]
+        bucket[2] += row["temp"]
+        bucket[3] += 1
+        return row["ts"].year
+
+    def provisional_row(self) -> Optional[Dict[str, Any]]:
+        """The last line when it has no newline yet (CSV files end without one)."""
+        text = self.tail.decode("utf-8", errors="replace").strip()
+        rows = self._rows([text], final=False) if text else []
+        return rows[0] if rows else None
+
+    def update(self) -> List[int]:
+        """Parse appended rows; returns the years whose report changed."""
+        lines, reset = self.reader.poll()
+        if reset:
+            self.years = {}
+            self.sections = {}
+        touched = {self._add(self.years, row) for row in self._rows(lines)}
+        if reset:
+            touched |= set(self.years)
+        tail_changed = self.reader.partial != self.tail
+        if tail_changed:
+            previous = self.provisional_row()
+            if previous is not None:
+                touched.add(previous["ts"].year)
+            self.tail = self.reader.partial
+        view = self.years
+        row = self.provisional_row()
+        if row is not None:
+            year = row["ts"].year
+            view = dict(self.years)
+            view[year] = list(view.get(year, [0.0, 0.0, 0.0, 0]))
+            self._add(view, row)
+            if tail_changed:
+                touched.add(year)
+        for year in touched:
+            if year not in view:
+                self.sections.pop(year, None)
+                continue
+            cons, prod, temp_sum, count = view[year]
+            stats = {"cons": cons, "prod": prod, "avg_temp": (temp_sum / count) if count else 0.0}
+            self.sections[year] = report_lines(f"Report for the year: {year}", stats)
+        return sorted(touched)
+
+    def render(self) -> str:
+        return "".join(line + "\n" for year in sorted(self.sections) for line in self.sections[year])
+
+
+def watch(csv_file: str = CSV_FILE, report_file: str = REPORT_FILE,
+          interval: float = POLL_INTERVAL) -> None:
+    """Poll the CSV and rewrite the yearly reports whenever rows are appended."""
+    totals = YearlyTotals(csv_file)
+    print(f"Watching {csv_file} (Ctrl+C to stop)")
+    try:
+        while True:
+            changed = totals.update()
+            if changed:
+                write_atomic(report_file, totals.render())
+                print(f"{time.strftime('%d.%m.%Y %H:%M:%S')} updated years {', '.join(map(str, changed))}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
@@ -0,0 +1,13 @@
+"""
+Makes the shared taskcore package importable when a script of this folder
+is started directly (python SCRIPT.py): the repository root is appended to
+sys.path.  Scripts import it before taskcore:
+
+    import _bootstrap  # noqa: F401
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
@@ -0,0 +1,166 @@
+# availability.py
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+#
+# Availability engine for reserved resources.
+#
+# Occupancy is kept per resource per day as an int bitmask of hours
+# (bit h = hour h..h+1 is booked).  A reservation sets its hour bits,
+# spilling over midnight into the next days when needed.  Searching for a
+# free N-hour slot is done with bitwise ops on the free mask, and monthly
+# availability calendars only count bits, so calendars for thousands of
+# resources are cheap.
+#
+# Records loaded with --encode are booked under their decoded resource
+# names when their SymbolTable is passed.
+#
+# Usage: python availability.py free RESOURCE HOURS [dd.mm.yyyy]
+#        python availability.py calendar MM.YYYY [RESOURCE ...]
+
+from __future__ import annotations
+import calendar
+import sys
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Optional
+
+import _bootstrap  # noqa: F401
+from taskcore.symbols import SymbolTable
+
+OPEN_HOUR = 8
+CLOSE_HOUR = 20
+MAX_SEARCH_DAYS = 366
+
+
+def hours_mask(start: int, end: int) -> int:
+    """Bits start..end-1 set."""
+    return ((1 << (end - start)) - 1) << start
+
+
+def runs_of(free: int, length: int) -> int:
+    """Bits where a run of `length` consecutive free hours starts."""
+    m = free
+    have = 1
+    while have < length:
+        step = min(have, length - have)
+        m &= m >> step
+        have += step
+    return m
+
+
+class Availability:
+    def __init__(self, open_hour: int = OPEN_HOUR, close_hour: int = CLOSE_HOUR,
+                 symbols: Optional[SymbolTable] = None):
+        self.symbols = symbols
+        self.open_mask = hours_mask(open_hour, close_hour)
+        self.open_hours = close_hour - open_hour
+        # resource -> day -> occupied hour bits
+        self.occupied: Dict[str, Dict[date, int]] = {}
+
+    def book(self, resource: str, day: date, start: time, duration: int) -> None:
+        """Mark a reservation's hours as occupied (partial hours occupy the whole hour)."""
+        days = self.occupied.setdefault(resource, {})
+        first = start.hour
+        last = start.hour + duration + (1 if start.minute or start.second else 0)
+        while first < last:
+            end = min(last, 24)
+            days[day] = days.get(day, 0) | hours_mask(first, end)
+            first, last = 0, last - 24
+            day += timedelta(days=1)
+
+    def add(self, reservation) -> None:
+        """Book a class (task_g_class), dict (task_g_dict) or list (TaskC) record."""
+        if isinstance(reservation, dict):
+            resource, day, start, duration = (reservation["resource"], reservation["date"],
+                                              reservation["time"], reservation["duration"])
+        elif isinstance(reservation, (list, tuple)):
+            resource, day, start, duration = reservation[9], reservation[4], reservation[5], reservation[6]
+        else:
+            resource, day, start, duration = (reservation.resource, reservation.date,
+                                              reservation.time, reservation.duration)
+        if self.symbols is not None:
+            resource = self.symbols.values[resource]
+        self.book(resource, day, start, duration)
+
+    def free_mask(self, resource: str, day: date) -> int:
+        return self.open_mask & ~self.occupied.get(resource, {}).get(day, 0)
+
+    def first_free_slot(self, resource: str, hours: int, after: datetime,
+                        max_days: int = MAX_SEARCH_DAYS) -> Optional[datetime]:
+        """Start of the first free `hours`-long slot within opening hours at or after `after`."""
+        if hours <= 0 or hours > self.open_hours:
+            return None
+        day = after.date()
+        first_hour = after.hour + (1 if after.minute or after.second else 0)
+        not_before = hours_mask(first_hour, 24) if first_hour < 24 else 0
+        for _ in range(max_days):
+            starts = runs_of(self.free_mask(resource, day) & not_before, hours)
+            if starts:
+                hour = (starts & -starts).bit_length() - 1
+                return datetime.combine(day, time(hour))
+            day += timedelta(days=1)
+            not_before = -1
+        return None
+
+    def free_hours(self, resource: str, day: date) -> int:
+        return self.free_mask(resource, day).bit_count()
+
+    def month_calendar(self, resource: str, year: int, month: int) -> str:
+        """
+        Month grid for one resource: every day shows its number and
+        ' ' all open hours free, '+' partly booked, '#' fully booked.
+        """
+        days = self.occupied.get(resource, {})
+        lines = [f"{resource} {month:02d}.{year}", "  Mo   Tu   We   Th   Fr   Sa   Su"]
+        for week in calendar.Calendar().monthdayscalendar(year, month):
+            cells = []
+            for d in week:
+                if d == 0:
+                    cells.append("    ")
+                    continue
+                booked = days.get(date(year, month, d), 0) & self.open_mask
+                mark = " " if not booked else ("#" if booked == self.open_mask else "+")
+                cells.append(f"{d:>3}{mark}")
+            lines.append(" ".join(cells).rstrip())
+        return "\n".join(lines) + "\n"
+
+    def calendars(self, year: int, month: int, resources: Optional[Iterable[str]] = None) -> str:
+        """Month grids for many resources, joined into one string."""
+        names = sorted(self.occupied) if resources is None else resources
+        return "\n".join(self.month_calendar(r, year, month) for r in names)
+
+
+def from_reservations(reservations: Iterable, symbols: Optional[SymbolTable] = None) -> Availability:
+    availability = Availability(symbols=symbols)
+    for r in reservations:
+        availability.add(r)
+    return availability
+
+
+def main() -> None:
+    from task_g_class import INPUT_FILE, fetch_reservations
+
+    # skip the header placeholder record
+    availability = from_reservations(fetch_reservations(INPUT_FILE)[1:])
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "free":
+        after = datetime.strptime(args[3], "%d.%m.%Y") if len(args) > 3 else datetime.now()
+        slot = availability.first_free_slot(args[1], int(args[2]), after)
+        if slot is None:
+            print("No free slot found.")
+        else:
+            print(f"First free {args[2]} h slot for {args[1]}: {slot.strftime('%d.%m.%Y at %H.%M')}")
+    elif len(args) >= 2 and args[0] == "calendar":
+        month, year = (int(x) for x in args[1].split("."))
+        print(availability.calendars(year, month, args[2:] or None), end="")
+    else:
+        print("Usage: python availability.py free RESOURCE HOURS [dd.mm.yyyy]")
+        print("       python availability.py calendar MM.YYYY [RESOURCE ...]")
+
+
+if __name__ == "__main__":
+    main()
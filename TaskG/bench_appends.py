@@ -0,0 +1,104 @@
+# bench_appends.py
+#
+# Appends/sec to a shared reservations file for 1, 8 and 64 concurrent
+# writer processes: naive per-line open/append/close (with and without
+# fsync) compared with taskcore's BatchAppender (one locked write + fsync
+# per batch).  A reader process polls the file under the shared lock
+# during the batched runs and counts torn lines; every run also checks
+# that all reservations arrived as whole lines.
+#
+# Usage: python bench_appends.py [TOTAL_APPENDS] [WRITERS ...]
+
+from __future__ import annotations
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import _bootstrap  # noqa: F401
+from taskcore.appender import FIELD_COUNT, BatchAppender, read_lines
+
+SAMPLE = "{id}|Writer {w}|writer{w}@example.com|0401234567|2025-11-12|09:00|2|18.50|True|Room {r}|2025-08-12 14:33:20"
+
+
+def records(writer: int, count: int) -> list:
+    return [SAMPLE.format(id=writer * 1_000_000 + i, w=writer, r=i % 40) for i in range(count)]
+
+
+def naive_writer(path: str, writer: int, count: int, fsync: bool, start) -> None:
+    lines = records(writer, count)
+    start.wait()
+    for line in lines:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def batched_writer(path: str, writer: int, count: int, start) -> None:
+    lines = records(writer, count)
+    start.wait()
+    with BatchAppender(path) as appender:
+        for line in lines:
+            appender.append(line)
+
+
+def torn_line_reader(path: str, stop, result) -> None:
+    torn = 0
+    while not stop.is_set():
+        lines = read_lines(path)
+        torn += sum(1 for line in lines if len(line.split("|")) != FIELD_COUNT)
+    result.value = torn
+
+
+def run(mode: str, writers: int, total: int, directory: str) -> None:
+    path = os.path.join(directory, f"{mode}-{writers}.txt")
+    open(path, "w").close()
+    per_writer = total // writers
+    start = multiprocessing.Event()
+    if mode == "batched":
+        procs = [multiprocessing.Process(target=batched_writer, args=(path, w, per_writer, start))
+                 for w in range(writers)]
+    else:
+        procs = [multiprocessing.Process(target=naive_writer, args=(path, w, per_writer, mode == "naive+fsync", start))
+                 for w in range(writers)]
+    for p in procs:
+        p.start()
+
+    reader = None
+    stop = multiprocessing.Event()
+    torn = multiprocessing.Value("i", 0)
+    if mode == "batched":
+        reader = multiprocessing.Process(target=torn_line_reader, args=(path, stop, torn))
+        reader.start()
+
+    t0 = time.perf_counter()
+    start.set()
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - t0
+    if reader is not None:
+        stop.set()
+        reader.join()
+
+    lines = [line for line in read_lines(path) if line.strip()]
+    whole = sum(1 for line in lines if len(line.split("|")) == FIELD_COUNT)
+    expected = per_writer * writers
+    status = "ok" if whole == len(lines) == expected else f"BROKEN ({whole}/{len(lines)} whole, {expected} expected)"
+    reader_note = f", reader saw {torn.value} torn lines" if reader is not None else ""
+    print(f"{mode:<12}{writers:>4} writers {elapsed:8.3f} s {expected / elapsed:>10,.0f} appends/s  {status}{reader_note}")
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 6400
+    writer_counts = [int(x) for x in sys.argv[2:]] or [1, 8, 64]
+    with tempfile.TemporaryDirectory() as directory:
+        for writers in writer_counts:
+            for mode in ("naive", "naive+fsync", "batched"):
+                run(mode, writers, total, directory)
+
+
+if __name__ == "__main__":
+    main()
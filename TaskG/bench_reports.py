@@ -0,0 +1,80 @@
+# bench_reports.py
+#
+# Lines/sec of the report sections with precompiled templates and memoized
+# date/time formatting, compared with the original per-line strftime + print.
+# Also checks that both produce the same bytes.
+#
+# Usage: python bench_reports.py [COUNT]
+
+from __future__ import annotations
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+from task_g_class import (Reservation, confirmation_statuses, confirmed_reservations,
+                          long_reservations, parse_datetime)
+
+
+def make_reservations(count: int) -> List[Reservation]:
+    reservations = [Reservation(0, "name", "email", "phone", date(1970, 1, 1), datetime(1970, 1, 1).time(),
+                                0, 0.0, False, "reservedResource", datetime(1970, 1, 1))]
+    start = date(2025, 1, 1)
+    for i in range(count):
+        reservations.append(Reservation(
+            reservation_id=i,
+            name=f"Customer {i % 5000}",
+            email=f"customer{i % 5000}@example.com",
+            phone=f"040{i % 5000:07d}",
+            date=start + timedelta(days=i % 365),
+            time=datetime(2025, 1, 1, 8 + i % 10, (i % 4) * 15).time(),
+            duration=1 + i % 6,
+            price=10.0 + i % 20,
+            confirmed=i % 3 != 0,
+            resource=f"Room {i % 40}",
+            created=parse_datetime("2025-01-01 00:00:00"),
+        ))
+    return reservations
+
+
+def original_sections(reservations: List[Reservation]) -> None:
+    for r in reservations[1:]:
+        if r.is_confirmed():
+            print(f'- {r.name}, {r.resource}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}')
+    for r in reservations[1:]:
+        if r.is_long():
+            print(f'- {r.name}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}, duration {r.duration} h, {r.resource}')
+    for r in reservations[1:]:
+        print(f'{r.name} → {"Confirmed" if r.confirmed else "NOT Confirmed"}')
+
+
+def template_sections(reservations: List[Reservation]) -> None:
+    confirmed_reservations(reservations)
+    long_reservations(reservations)
+    confirmation_statuses(reservations)
+
+
+def run(fn: Callable, reservations: List[Reservation]) -> tuple:
+    sink = io.StringIO()
+    t0 = time.perf_counter()
+    with redirect_stdout(sink):
+        fn(reservations)
+    return time.perf_counter() - t0, sink.getvalue()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    reservations = make_reservations(count)
+    original_time, original_out = run(original_sections, reservations)
+    template_time, template_out = run(template_sections, reservations)
+    lines = original_out.count("\n")
+    print(f"{count} reservations, {lines} report lines")
+    print(f"original:  {original_time:7.3f} s {lines / original_time:>12,.0f} lines/s")
+    print(f"templates: {template_time:7.3f} s {lines / template_time:>12,.0f} lines/s")
+    print(f"same output: {original_out == template_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# cube.py
+# Copyright (c) 2026 Ville Heikkiniemi, Luka Hietala, Luukas Kola
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+#
+# Revenue and occupancy cube for reservations.
+#
+# Every reservation is added once to the cells of its day, ISO week and
+# month, both for its resource and for all resources together.  Queries and
+# drill-downs (month -> weeks/days) read those cells and never rescan the
+# reservations, and new bookings are added to the cube incrementally.
+#
+# Works with the class (task_g_class), dict (task_g_dict) and list (TaskC)
+# reservation records; for records loaded with --encode pass their
+# SymbolTable, and the resources are decoded to their names when added.
+#
+# Usage: python cube.py [day|week|month] [resource]
+
+from __future__ import annotations
+import sys
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import _bootstrap  # noqa: F401
+from taskcore.symbols import SymbolTable
+
+GRAINS = ("day", "week", "month")
+ALL = None  # resource key for the totals over all resources
+
+# cell: [bookings, confirmed bookings, hours, confirmed hours, revenue]
+BOOKINGS, CONFIRMED, HOURS, CONFIRMED_HOURS, REVENUE = range(5)
+
+
+def period_key(grain: str, day: date) -> Tuple:
+    if grain == "day":
+        return (day.year, day.month, day.day)
+    if grain == "week":
+        iso = day.isocalendar()
+        return (iso[0], iso[1])
+    return (day.year, day.month)
+
+
+def format_period(grain: str, key: Tuple) -> str:
+    if grain == "day":
+        return f"{key[2]:02d}.{key[1]:02d}.{key[0]}"
+    if grain == "week":
+        return f"{key[0]} w{key[1]:02d}"
+    return f"{key[1]:02d}.{key[0]}"
+
+
+def reservation_fields(r) -> Tuple[str, date, int, float, bool]:
+    """(resource, date, duration, price, confirmed) of a class, dict or list record."""
+    if isinstance(r, dict):
+        return r["resource"], r["date"], r["duration"], r["price"], r["confirmed"]
+    if isinstance(r, (list, tuple)):
+        return r[9], r[4], r[6], r[7], r[8]
+    return r.resource, r.date, r.duration, r.price, r.confirmed
+
+
+class ReservationCube:
+    def __init__(self, reservations=(), symbols: Optional[SymbolTable] = None):
+        # grain -> resource -> period key -> cell
+        self.cells: Dict[str, Dict[Optional[str], Dict[Tuple, List[float]]]] = {g: {} for g in GRAINS}
+        self.symbols = symbols
+        for r in reservations:
+            self.add(r)
+
+    def add(self, reservation) -> None:
+        """Add one reservation (incremental update)."""
+        resource, day, duration, price, confirmed = reservation_fields(reservation)
+        if self.symbols is not None:
+            resource = self.symbols.values[resource]
+        self.add_fields(resource, day, duration, price, confirmed)
+
+    def add_fields(self, resource: str, day: date, duration: int, price: float, confirmed: bool) -> None:
+        for grain in GRAINS:
+            key = period_key(grain, day)
+            for res in (resource, ALL):
+                cell = self.cells[grain].setdefault(res, {}).get(key)
+                if cell is None:
+                    cell = self.cells[grain][res][key] = [0, 0, 0, 0, 0.0]
+                cell[BOOKINGS] += 1
+                cell[HOURS] += duration
+                if confirmed:
+                    cell[CONFIRMED] += 1
+                    cell[CONFIRMED_HOURS] += duration
+                    cell[REVENUE] += duration * price
+
+    def resources(self) -> List[str]:
+        return sorted(r for r in self.cells["month"] if r is not ALL)
+
+    def query(self, grain: str, resource: Optional[str] = ALL,
+              start: Optional[date] = None, end: Optional[date] = None) -> List[Tuple[Tuple, List[float]]]:
+        """Cells of one grain (optionally for one resource and a date range), in period order."""
+        cells = self.cells[grain].get(resource, {})
+        lo = period_key(grain, start) if start else None
+        hi = period_key(grain, end) if end else None
+        return [
+            (key, cells[key]) for key in sorted(cells)
+            if (lo is None or key >= lo) and (hi is None or key <= hi)
+        ]
+
+    def cell(self, grain: str, day: date, resource: Optional[str] = ALL) -> List[float]:
+        """The cell containing day, or an empty cell."""
+        return self.cells[grain].get(resource, {}).get(period_key(grain, day), [0, 0, 0, 0, 0.0])
+
+    def drill_down(self, year: int, month: int, grain: str = "day",
+                   resource: Optional[str] = ALL) -> List[Tuple[Tuple, List[float]]]:
+        """Weeks or days of one month, read from the precomputed cells."""
+        start = date(year, month, 1)
+        end = (start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        return self.query(grain, resource, start, end)
+
+    def by_resource(self, grain: str, day: date) -> List[Tuple[str, List[float]]]:
+        """All resources' cells for the period containing day."""
+        key = period_key(grain, day)
+        return [
+            (res, cells[key]) for res, cells in sorted(self.cells[grain].items(), key=lambda x: x[0] or "")
+            if res is not ALL and key in cells
+        ]
+
+
+def print_cells(grain: str, rows: List[Tuple[Tuple, List[float]]]) -> None:
+    print(f"{'Period':<12}{'Bookings':>10}{'Confirmed':>11}{'Hours':>8}{'Revenue':>12}")
+    for key, c in rows:
+        revenue = f"{c[REVENUE]:.2f} €".replace(".", ",")
+        print(f"{format_period(grain, key):<12}{c[BOOKINGS]:>10}{c[CONFIRMED]:>11}{c[CONFIRMED_HOURS]:>8}{revenue:>12}")
+
+
+def main() -> None:
+    from task_g_class import INPUT_FILE, fetch_reservations
+
+    grain = sys.argv[1] if len(sys.argv) > 1 else "month"
+    resource = sys.argv[2] if len(sys.argv) > 2 else ALL
+    # skip the header placeholder record
+    cube = ReservationCube(fetch_reservations(INPUT_FILE)[1:])
+    print(f"{grain.capitalize()} revenue and occupancy: {resource or 'all resources'}")
+    print_cells(grain, cube.query(grain, resource))
+
+
+if __name__ == "__main__":
+    main()
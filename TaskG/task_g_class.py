@@ -13,11 +13,18 @@
 # Behavior and output are preserved.
 
 from __future__ import annotations
+import sys
 from datetime import datetime, date, time
-from typing import List
 
+import _bootstrap  # noqa: F401
+from taskcore.appender import read_lines
+from taskcore.report_format import CONFIRMED_LINE, LONG_LINE, STATUS_LINE, format_date, format_time, print_section
+from taskcore.reservations import parse_bool, parse_date, parse_datetime, parse_time
+from taskcore.symbols import SymbolTable, decoder
 
 INPUT_FILE = "reservations.txt"
+# dictionary encoded with --encode
+TEXT_FIELDS = ("name", "email", "phone", "resource")
 
 
 class Reservation:
@@ -57,25 +64,8 @@ class Reservation:
         return self.duration * self.price
 
 
-def parse_bool(value: str) -> bool:
-    v = value.strip()
-    return v == "True" or v.lower() in ("1", "true", "yes", "y", "t")
-
-
-def parse_date(value: str) -> date:
-    return datetime.strptime(value.strip(), "%Y-%m-%d").date()
-
-
-def parse_time(value: str) -> time:
-    return datetime.strptime(value.strip(), "%H:%M").time()
-
-
-def parse_datetime(value: str) -> datetime:
-    return datetime.strptime(value.strip(), "%Y-%m-%d %H:%M:%S")
-
-
-def convert_reservation_data_to_object(fields: List[str]) -> Reservation:
-    return Reservation(
+def convert_reservation_data_to_object(fields: list[str], symbols: SymbolTable | None = None) -> Reservation:
+    reservation = Reservation(
         reservation_id=int(fields[0].strip()),
         name=fields[1].strip(),
         email=fields[2].strip(),
@@ -88,10 +78,15 @@ def convert_reservation_data_to_object(fields: List[str]) -> Reservation:
         resource=fields[9].strip(),
         created=parse_datetime(fields[10]),
     )
+    if symbols is not None:
+        # text fields become shared int codes, decoded by the reports
+        for field in TEXT_FIELDS:
+            setattr(reservation, field, symbols.encode(getattr(reservation, field)))
+    return reservation
 
 
-def fetch_reservations(path: str = INPUT_FILE) -> List[Reservation]:
-    reservations: List[Reservation] = []
+def fetch_reservations(path: str = INPUT_FILE, symbols: SymbolTable | None = None) -> list[Reservation]:
+    reservations: list[Reservation] = []
     # keep header placeholder to preserve indexing logic parity with original program
     # header will be a dummy Reservation with string fields where appropriate
     reservations.append(
@@ -109,51 +104,58 @@ def fetch_reservations(path: str = INPUT_FILE) -> List[Reservation]:
             created=parse_datetime("1970-01-01 00:00:00"),
         )
     )
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            if len(line) > 1:
-                parts = line.split("|")
-                reservations.append(convert_reservation_data_to_object(parts))
+    for line in read_lines(path):
+        if len(line) > 1:
+            parts = line.split("|")
+            reservations.append(convert_reservation_data_to_object(parts, symbols))
     return reservations
 
 
-def confirmed_reservations(reservations: List[Reservation]) -> None:
-    for r in reservations[1:]:
-        if r.is_confirmed():
-            print(f'- {r.name}, {r.resource}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}')
+def confirmed_reservations(reservations: list[Reservation], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        CONFIRMED_LINE(text(r.name), text(r.resource), format_date(r.date), format_time(r.time))
+        for r in reservations[1:]
+        if r.is_confirmed()
+    ])
 
 
-def long_reservations(reservations: List[Reservation]) -> None:
-    for r in reservations[1:]:
-        if r.is_long():
-            print(f'- {r.name}, {r.date.strftime("%d.%m.%Y")} at {r.time.strftime("%H.%M")}, duration {r.duration} h, {r.resource}')
+def long_reservations(reservations: list[Reservation], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        LONG_LINE(text(r.name), format_date(r.date), format_time(r.time), r.duration, text(r.resource))
+        for r in reservations[1:]
+        if r.is_long()
+    ])
 
 
-def confirmation_statuses(reservations: List[Reservation]) -> None:
-    for r in reservations[1:]:
-        name: str = r.name
-        confirmed: bool = r.confirmed
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+def confirmation_statuses(reservations: list[Reservation], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        STATUS_LINE(text(r.name), "Confirmed" if r.confirmed else "NOT Confirmed")
+        for r in reservations[1:]
+    ])
 
 
-def confirmation_summary(reservations: List[Reservation]) -> None:
+def confirmation_summary(reservations: list[Reservation]) -> None:
     confirmed_count: int = len([x for x in reservations[1:] if x.confirmed])
     print(f'- Confirmed reservations: {confirmed_count} pcs\n- Not confirmed reservations: {len(reservations) - confirmed_count} pcs')
 
 
-def total_revenue(reservations: List[Reservation]) -> None:
+def total_revenue(reservations: list[Reservation]) -> None:
     revenue: float = sum(x.total_price() for x in reservations[1:] if x.confirmed)
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
 
-def main() -> None:
-    reservations = fetch_reservations(INPUT_FILE)
+def main(encode: bool = False) -> None:
+    symbols = SymbolTable() if encode else None
+    reservations = fetch_reservations(INPUT_FILE, symbols)
     print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
+    confirmed_reservations(reservations, symbols)
     print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
+    long_reservations(reservations, symbols)
     print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
+    confirmation_statuses(reservations, symbols)
     print("4) Confirmation Summary")
     confirmation_summary(reservations)
     print("5) Total Revenue from Confirmed Reservations")
@@ -161,4 +163,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main("--encode" in sys.argv[1:])
@@ -13,39 +13,29 @@
 # Behavior and output are preserved.
 
 from __future__ import annotations
-from datetime import datetime, date, time
-from typing import List, Dict
+import sys
 
+import _bootstrap  # noqa: F401
+from taskcore.appender import read_lines
+from taskcore.report_format import CONFIRMED_LINE, LONG_LINE, STATUS_LINE, format_date, format_time, print_section
+from taskcore.reservations import parse_bool, parse_date, parse_datetime, parse_time
+from taskcore.symbols import SymbolTable, decoder
 
 INPUT_FILE = "reservations.txt"
+# dictionary encoded with --encode
+TEXT_FIELDS = ("name", "email", "phone", "resource")
 
 
-def parse_bool(value: str) -> bool:
-    v = value.strip()
-    return v == "True" or v.lower() in ("1", "true", "yes", "y", "t")
-
-
-def parse_date(value: str) -> date:
-    return datetime.strptime(value.strip(), "%Y-%m-%d").date()
-
-
-def parse_time(value: str) -> time:
-    return datetime.strptime(value.strip(), "%H:%M").time()
-
-
-def parse_datetime(value: str) -> datetime:
-    return datetime.strptime(value.strip(), "%Y-%m-%d %H:%M:%S")
-
-
-def convert_reservation_data_to_dict(fields: List[str]) -> Dict:
+def convert_reservation_data_to_dict(fields: list[str], symbols: SymbolTable | None = None) -> dict:
     """
     Convert a list of 11 string fields into a dictionary with proper types.
+    With a SymbolTable the text fields are stored as its int codes.
     Field order expected:
     0: reservationId, 1: name, 2: email, 3: phone,
     4: reservationDate (YYYY-MM-DD), 5: reservationTime (HH:MM),
     6: durationHours, 7: price, 8: confirmed, 9: reservedResource, 10: createdAt (YYYY-MM-DD HH:MM:SS)
     """
-    return {
+    reservation = {
         "id": int(fields[0].strip()),
         "name": fields[1].strip(),
         "email": fields[2].strip(),
@@ -58,14 +48,18 @@ def convert_reservation_data_to_dict(fields: List[str]) -> Dict:
         "resource": fields[9].strip(),
         "created": parse_datetime(fields[10]),
     }
+    if symbols is not None:
+        for key in TEXT_FIELDS:
+            reservation[key] = symbols.encode(reservation[key])
+    return reservation
 
 
-def fetch_reservations(path: str = INPUT_FILE) -> List[Dict]:
+def fetch_reservations(path: str = INPUT_FILE, symbols: SymbolTable | None = None) -> list[dict]:
     """
     Read reservations.txt and return a list of reservation dictionaries.
     The first line in the file is treated as header and skipped.
     """
-    reservations: List[Dict] = []
+    reservations: list[dict] = []
     # Add header as in original program (kept for parity with original fetch_reservations)
     reservations.append(
         {
@@ -82,54 +76,61 @@ def fetch_reservations(path: str = INPUT_FILE) -> List[Dict]:
             "created": "createdAt",
         }
     )
-    with open(path, "r", encoding="utf-8") as fh:
-        for line in fh:
-            if len(line) > 1:
-                parts = line.split("|")
-                # convert and append
-                reservations.append(convert_reservation_data_to_dict(parts))
+    for line in read_lines(path):
+        if len(line) > 1:
+            parts = line.split("|")
+            # convert and append
+            reservations.append(convert_reservation_data_to_dict(parts, symbols))
     return reservations
 
 
-def confirmed_reservations(reservations: List[Dict]) -> None:
-    for r in reservations[1:]:
-        if r["confirmed"]:
-            print(f'- {r["name"]}, {r["resource"]}, {r["date"].strftime("%d.%m.%Y")} at {r["time"].strftime("%H.%M")}')
+def confirmed_reservations(reservations: list[dict], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        CONFIRMED_LINE(text(r["name"]), text(r["resource"]), format_date(r["date"]), format_time(r["time"]))
+        for r in reservations[1:]
+        if r["confirmed"]
+    ])
 
 
-def long_reservations(reservations: List[Dict]) -> None:
-    for r in reservations[1:]:
-        # original used > 3
-        if r["duration"] > 3:
-            print(f'- {r["name"]}, {r["date"].strftime("%d.%m.%Y")} at {r["time"].strftime("%H.%M")}, duration {r["duration"]} h, {r["resource"]}')
+def long_reservations(reservations: list[dict], symbols: SymbolTable | None = None) -> None:
+    # original used > 3
+    text = decoder(symbols)
+    print_section([
+        LONG_LINE(text(r["name"]), format_date(r["date"]), format_time(r["time"]), r["duration"], text(r["resource"]))
+        for r in reservations[1:]
+        if r["duration"] > 3
+    ])
 
 
-def confirmation_statuses(reservations: List[Dict]) -> None:
-    for r in reservations[1:]:
-        name: str = r["name"]
-        confirmed: bool = r["confirmed"]
-        print(f'{name} → {"Confirmed" if confirmed else "NOT Confirmed"}')
+def confirmation_statuses(reservations: list[dict], symbols: SymbolTable | None = None) -> None:
+    text = decoder(symbols)
+    print_section([
+        STATUS_LINE(text(r["name"]), "Confirmed" if r["confirmed"] else "NOT Confirmed")
+        for r in reservations[1:]
+    ])
 
 
-def confirmation_summary(reservations: List[Dict]) -> None:
+def confirmation_summary(reservations: list[dict]) -> None:
     confirmed_count: int = len([x for x in reservations[1:] if x["confirmed"]])
     print(f'- Confirmed reservations: {confirmed_count} pcs\n- Not confirmed reservations: {len(reservations) - confirmed_count} pcs')
 
 
-def total_revenue(reservations: List[Dict]) -> None:
+def total_revenue(reservations: list[dict]) -> None:
     revenue: float = sum(x["duration"] * x["price"] for x in reservations[1:] if x["confirmed"])
     # keep the same formatting as original (comma as decimal separator)
     print(f'Total revenue from confirmed reservations: {revenue:.2f} €'.replace('.', ','))
 
 
-def main() -> None:
-    reservations = fetch_reservations(INPUT_FILE)
+def main(encode: bool = False) -> None:
+    symbols = SymbolTable() if encode else None
+    reservations = fetch_reservations(INPUT_FILE, symbols)
     print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
+    confirmed_reservations(reservations, symbols)
     print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
+    long_reservations(reservations, symbols)
     print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
+    confirmation_statuses(reservations, symbols)
     print("4) Confirmation Summary")
     confirmation_summary(reservations)
     print("5) Total Revenue from Confirmed Reservations")
@@ -137,4 +138,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main("--encode" in sys.argv[1:])
@@ -0,0 +1,342 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Micro-benchmarks and regression gate for the parse/aggregate hot paths.
+
+Every benchmark runs one function over generated (seeded, so identical on
+every run) inputs and reports the best time per row over several repeats
+(perf_counter, garbage collector off as in timeit) and the peak memory of
+one run (tracemalloc).
+
+The results are compared with baseline.json.  Timings are first scaled by
+a calibration loop measured on both machines, so a baseline recorded on
+a faster or slower machine still applies.  A benchmark fails when it is
+more than --threshold slower (or uses that much more peak memory) than
+its baseline in every re-measurement; the exit status is then 1.  Each
+re-measurement is paired with a fresh calibration and scaled by it, so a
+machine that is busy for a while does not count as a regression.
+
+Usage:
+  python benchmarks/hotpaths.py                 compare with the baseline
+  python benchmarks/hotpaths.py --update        record a new baseline
+  python benchmarks/hotpaths.py --only taskf    run matching benchmarks
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from _bootstrap import ROOT
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+THRESHOLD = 0.25  # allowed slowdown / memory growth
+REPEAT = 11
+RETRIES = 5  # re-measurements of a failing benchmark before it counts as a regression
+
+# the task modules have distinct names, so their folders can share sys.path
+for folder in ("TaskC", "TaskE", "TaskF", "TaskG"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+
+os.environ["TZ"] = "Europe/Helsinki"  # TaskF converts offsets to local time
+if hasattr(time, "tzset"):
+    time.tzset()
+
+import task_c  # noqa: E402
+import task_e  # noqa: E402
+import task_f  # noqa: E402
+import task_g_class  # noqa: E402
+import task_g_dict  # noqa: E402
+from taskcore.symbols import SymbolTable  # noqa: E402
+
+# name -> (setup() -> (function, args, rows per call))
+Benchmark = Callable[[], Tuple[Callable, tuple, int]]
+
+
+def reservation_fields(count: int) -> List[List[str]]:
+    rng = random.Random(46)
+    rows = []
+    for i in range(count):
+        customer = rng.randrange(500)
+        rows.append([
+            str(1000 + i), f"Customer {customer}", f"customer{customer}@example.com", f"040{customer:07d}",
+            (date(2025, 1, 1) + timedelta(days=rng.randrange(365))).isoformat(),
+            f"{rng.randrange(8, 20):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+            str(rng.randrange(1, 6)), f"{rng.randrange(10, 40)}.50", rng.choice(("True", "False")),
+            f"Room {rng.randrange(40)}", "2025-08-12 14:33:20\n",
+        ])
+    return rows
+
+
+def phase_fields(hours: int) -> List[List[str]]:
+    rng = random.Random(47)
+    start = datetime(2025, 10, 13)
+    return [
+        [(start + timedelta(hours=h)).isoformat()] + [str(rng.randrange(2000)) for _ in range(6)]
+        for h in range(hours)
+    ]
+
+
+def energy_lines(hours: int) -> List[str]:
+    """Hourly rows of the 2025.csv format (offsets, comma decimals)."""
+    rng = random.Random(48)
+    comma = lambda x: x.replace(".", ",")
+    start = datetime(2025, 1, 1)
+    lines = []
+    for h in range(hours):
+        ts = start + timedelta(hours=h)
+        offset = "+03:00" if 4 <= ts.month <= 10 else "+02:00"
+        lines.append(f"{ts.isoformat()}.000{offset};{comma(f'{rng.randrange(4000) / 1000:.3f}')};"
+                     f"{comma(f'{rng.randrange(2000) / 1000:.3f}')};{comma(f'{rng.randrange(-200, 250) / 10:.1f}')}")
+    return lines
+
+
+def _each(fn: Callable) -> Callable:
+    """Calls fn once per input item and keeps the results (peak memory = loaded rows)."""
+    def run(items):
+        return [fn(item) for item in items]
+    return run
+
+
+TEMP_FILES: Dict[str, str] = {}
+
+
+def temp_file(suffix: str, lines: Callable[[], List[str]]) -> str:
+    """Generated input file, written once per run and removed at exit."""
+    if suffix not in TEMP_FILES:
+        fd, TEMP_FILES[suffix] = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines()))
+    return TEMP_FILES[suffix]
+
+
+def energy_file() -> str:
+    """One-year hourly CSV."""
+    return temp_file(".csv", lambda: ["Time;Consumption (net) kWh;Production (net) kWh;Daily average temperature"]
+                     + energy_lines(8760))
+
+
+def reservations_file() -> str:
+    """reservations.txt with 5000 rows: the fields of every row are fresh strings when read."""
+    return temp_file(".txt", lambda: ["|".join(r).rstrip("\n") for r in reservation_fields(5000)])
+
+
+def _fetch(fetch: Callable, encoded: bool) -> Callable:
+    """Loads the reservations file; encoded runs get a fresh SymbolTable (part of the peak)."""
+    def run(path):
+        return fetch(path, SymbolTable() if encoded else None)
+    return run
+
+
+def bench_task_c_convert():
+    rows = reservation_fields(5000)
+    return _each(task_c.convert_reservation_data), (rows,), len(rows)
+
+
+def bench_task_g_object():
+    rows = reservation_fields(5000)
+    return _each(task_g_class.convert_reservation_data_to_object), (rows,), len(rows)
+
+
+def bench_task_g_dict():
+    rows = reservation_fields(5000)
+    return _each(task_g_dict.convert_reservation_data_to_dict), (rows,), len(rows)
+
+
+def bench_task_c_fetch(encoded: bool = False):
+    return _fetch(task_c.fetch_reservations, encoded), (reservations_file(),), 5000
+
+
+def bench_task_g_fetch(encoded: bool = False):
+    return _fetch(task_g_class.fetch_reservations, encoded), (reservations_file(),), 5000
+
+
+def bench_task_e_convert():
+    rows = phase_fields(24 * 7 * 30)
+    return _each(task_e.convert_data), (rows,), len(rows)
+
+
+def bench_task_e_day_information():
+    database = [task_e.convert_data(r) for r in phase_fields(24 * 7)]
+    days = sorted({row[0].date() for row in database})
+
+    def run(days):
+        for d in days:
+            task_e.day_information(d, database)
+    return run, (days,), len(days) * len(database)  # every call scans the week
+
+
+def bench_task_f_parse_timestamp():
+    stamps = [line.split(";")[0] for line in energy_lines(8760)]
+    return _each(task_f.parse_timestamp), (stamps,), len(stamps)
+
+
+def bench_task_f_read_data():
+    return task_f.read_data, (energy_file(),), 8760
+
+
+def bench_task_f_calc_range():
+    rows = task_f.read_data(energy_file())
+    return task_f.calc_range, (rows, datetime(2025, 1, 1), datetime(2025, 12, 31)), len(rows)
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "taskc.convert_reservation_data": bench_task_c_convert,
+    "taskg.convert_reservation_data_to_object": bench_task_g_object,
+    "taskg.convert_reservation_data_to_dict": bench_task_g_dict,
+    "taskc.fetch_reservations": bench_task_c_fetch,
+    "taskc.fetch_reservations.encoded": lambda: bench_task_c_fetch(encoded=True),
+    "taskg.fetch_reservations": bench_task_g_fetch,
+    "taskg.fetch_reservations.encoded": lambda: bench_task_g_fetch(encoded=True),
+    "taske.convert_data": bench_task_e_convert,
+    "taske.day_information": bench_task_e_day_information,
+    "taskf.parse_timestamp": bench_task_f_parse_timestamp,
+    "taskf.read_data": bench_task_f_read_data,
+    "taskf.calc_range": bench_task_f_calc_range,
+}
+
+
+def calibrate(repeat: int = REPEAT) -> float:
+    """ns per iteration of a fixed pure-Python loop (machine speed reference)."""
+    def loop():
+        total = 0
+        for i in range(200_000):
+            total += i % 7
+        return total
+    best = min(_timed(loop, ()) for _ in range(repeat))
+    return best / 200_000 * 1e9
+
+
+def _timed(fn: Callable, args: tuple) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def measure(setup: Benchmark, repeat: int = REPEAT) -> Dict[str, float]:
+    fn, args, rows = setup()
+    fn(*args)  # warm-up (caches, first imports)
+    gc.collect()
+    gc.disable()  # like timeit: collector pauses are not part of the hot path
+    try:
+        best = min(_timed(fn, args) for _ in range(repeat))
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ns_per_row": best / rows * 1e9, "peak_kib": peak / 1024}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: dict, calibration: float,
+            threshold: float) -> List[str]:
+    """Lines describing the regressions (empty when everything is within the threshold)."""
+    scale = calibration / baseline["calibration_ns"]
+    failures = []
+    for name, result in results.items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        limit = base["ns_per_row"] * scale * (1 + threshold)
+        if result["ns_per_row"] > limit:
+            failures.append(f"{name}: {result['ns_per_row']:.0f} ns/row > {limit:.0f} allowed")
+        memory_limit = base["peak_kib"] * (1 + threshold) + 64  # small absolute slack for tiny peaks
+        if result["peak_kib"] > memory_limit:
+            failures.append(f"{name}: peak {result['peak_kib']:.0f} KiB > {memory_limit:.0f} KiB allowed")
+    return failures
+
+
+def run(args: argparse.Namespace) -> int:
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    calibration = calibrate(args.repeat)
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if not args.only or args.only in name:
+            results[name] = measure(setup, args.repeat)
+    # the CPU is often slower right at start-up; the faster of the two readings is the steady state
+    calibration = min(calibration, calibrate(args.repeat))
+
+    scale = calibration / baseline["calibration_ns"] if baseline else 1.0
+    print(f"calibration {calibration:.1f} ns/iteration"
+          + (f" (baseline {baseline['calibration_ns']:.1f})" if baseline else ""))
+    print(f"{'benchmark':<44}{'ns/row':>10}{'baseline':>10}{'change':>9}{'peak KiB':>11}")
+    for name, result in results.items():
+        base = baseline["benchmarks"].get(name) if baseline else None
+        if base:
+            expected = base["ns_per_row"] * scale
+            print(f"{name:<44}{result['ns_per_row']:>10.0f}{expected:>10.0f}"
+                  f"{result['ns_per_row'] / expected - 1:>+9.0%}{result['peak_kib']:>11.0f}")
+        else:
+            print(f"{name:<44}{result['ns_per_row']:>10.0f}{'-':>10}{'':>9}{result['peak_kib']:>11.0f}")
+
+    if args.update:
+        if args.only and baseline:
+            # partial update: keep the other entries, stored at the baseline's calibration
+            merged = dict(baseline["benchmarks"])
+            for name, result in results.items():
+                merged[name] = dict(result, ns_per_row=result["ns_per_row"] / scale)
+            results, calibration = merged, baseline["calibration_ns"]
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"calibration_ns": calibration, "threshold": args.threshold, "benchmarks": results},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        print("no baseline, run with --update to record one")
+        return 0
+
+    failures = compare(results, baseline, calibration, args.threshold)
+    for _ in range(RETRIES):
+        if not failures:
+            break
+        # a noisy neighbour can slow one measurement; a regression must persist
+        for name in [n for n in results if any(line.startswith(f"{n}:") for line in failures)]:
+            local = calibrate(args.repeat)
+            again = measure(BENCHMARKS[name], args.repeat)
+            again["ns_per_row"] *= calibration / max(local, calibration)
+            results[name] = {key: min(results[name][key], again[key]) for key in again}
+            print(f"re-measured {name}: {results[name]['ns_per_row']:.0f} ns/row")
+        failures = compare(results, baseline, calibration, args.threshold)
+    for line in failures:
+        print(f"REGRESSION {line}")
+    print("FAILED" if failures else f"OK (threshold {args.threshold:.0%})")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hot path micro-benchmarks with a regression gate")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown, e.g. 0.25 = 25 %%")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this text")
+    args = parser.parse_args(argv)
+
+    try:
+        return run(args)
+    finally:
+        for path in TEMP_FILES.values():
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Throughput benchmark: 100k receipts rendered by the TaskA and TaskB
+printers (shared decode in taskcore.receipts, one template each) compared
+with the original per-field split / strptime / print approach.
+
+Usage:
+  python benchmarks/receipts.py [COUNT]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from _bootstrap import ROOT
+
+# the task modules have distinct names, so their folders can share sys.path
+for folder in ("TaskA", "TaskB"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+
+import task_a  # noqa: E402
+import task_b  # noqa: E402
+from taskcore.receipts import render_receipts  # noqa: E402
+
+SAMPLE = "123|Anna Virtanen|2025-10-31|10:00|2|19.95|True|Meeting Room A|0401234567|anna.virtanen@example.com"
+
+
+def make_lines(count: int) -> list:
+    lines = []
+    for i in range(count):
+        fields = SAMPLE.split("|")
+        fields[0] = str(i)
+        fields[2] = f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+        fields[4] = str(i % 8 + 1)
+        fields[6] = "True" if i % 3 else "False"
+        lines.append("|".join(fields) + "\n")
+    return lines
+
+
+def original_receipts(lines: list) -> None:
+    """The previous approach: split per field, strptime, one print per field."""
+    for reservation in lines:
+        reservation = reservation.strip()
+        print(f"Reservation number: {int(reservation.split('|')[0])}")
+        print(f"Booker: {reservation.split('|')[1]}")
+        day = datetime.strptime(reservation.split('|')[2], "%Y-%m-%d").date()
+        print(f"Date: {day.strftime('%d.%m.%Y')}")
+        t = datetime.strptime(reservation.split('|')[3], "%H:%M").time()
+        print(f"Start time: {t.strftime('%H.%M')}")
+        hours = int(reservation.split('|')[4])
+        print(f"Number of hours: {hours}")
+        rate = float(reservation.split('|')[5])
+        print(f"Hourly rate: {rate:.2f}".replace('.', ',') + " €")
+        print(f"Total price: {hours * rate:.2f}".replace('.', ',') + " €")
+        print(f"Paid: {'Yes' if reservation.split('|')[6] == 'True' else 'No'}")
+        print(f"Venue: {reservation.split('|')[7]}")
+        print(f"Phone: {reservation.split('|')[8]}")
+        print(f"Email: {reservation.split('|')[9]}")
+        print()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lines = make_lines(count)
+
+    sink = io.StringIO()
+    t0 = time.perf_counter()
+    with redirect_stdout(sink):
+        original_receipts(lines)
+    original = time.perf_counter() - t0
+
+    timings = {}
+    for name, module in (("TaskA", task_a), ("TaskB", task_b)):
+        sink = io.StringIO()
+        t0 = time.perf_counter()
+        sink.write(render_receipts(lines, module.render_receipt))
+        timings[name] = time.perf_counter() - t0
+
+    print(f"{count} receipts")
+    print(f"original: {original:8.3f} s {count / original:>12,.0f} receipts/s")
+    for name, elapsed in timings.items():
+        print(f"{name}:    {elapsed:8.3f} s {count / elapsed:>12,.0f} receipts/s  ({original / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
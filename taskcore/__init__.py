@@ -0,0 +1,64 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Shared helpers for the task programs.
+
+  phases        hourly per-phase week CSVs (TaskD, TaskE)
+  extsort       external merge sort of time-stamped CSV lines
+  reservations  field parsers of reservations.txt (TaskC, TaskG)
+  report_format report line layouts and memoized date/time formatting
+  tail          append-only file polling and atomic report writes
+  appender      locked, batched appends to reservations.txt
+  symbols       dictionary encoding of repeating reservation fields
+  receipts      typed decoding and rendering of receipts (TaskA, TaskB)
+
+Submodules are imported lazily on first attribute access, so
+`import taskcore` costs nothing at start-up; a program only pays for the
+parsers it actually uses.
+
+Run any report from its folder (python task_x.py) or with
+python -m taskcore REPORT [args].  Each task folder has a _bootstrap
+module that puts the repository root on sys.path; the programs import it
+before taskcore.
+"""
+
+_EXPORTS = {
+    "convert_data": "phases",
+    "read_data": "phases",
+    "merged_rows": "phases",
+    "external_sort": "extsort",
+    "keyed_lines": "extsort",
+    "parse_bool": "reservations",
+    "parse_date": "reservations",
+    "parse_time": "reservations",
+    "parse_datetime": "reservations",
+    "AppendReader": "tail",
+    "write_atomic": "tail",
+    "BatchAppender": "appender",
+    "read_lines": "appender",
+    "SymbolTable": "symbols",
+    "decode_reservation": "receipts",
+    "render_receipts": "receipts",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
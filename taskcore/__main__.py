@@ -0,0 +1,92 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Single entry point for all reports:
+
+  python -m taskcore REPORT [args]
+  python -m taskcore FOLDER/SCRIPT.py [args]  (any other script, e.g. a benchmark)
+  python -m taskcore --list
+  python /path/to/taskcore REPORT [args]    (from any directory, e.g. cron)
+
+The report runs inside its task folder, exactly as if it had been started
+there with `python SCRIPT [args]`, so its relative data files are found.
+Only the chosen script is loaded.
+
+The programs make taskcore importable themselves (import _bootstrap, the
+small module next to them that puts the repository root on sys.path), so
+they run the same way from their own folder.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# report name -> (task folder, script)
+REPORTS = {
+    "task_a": ("TaskA", "task_a.py"),
+    "task_b": ("TaskB", "task_b.py"),
+    "task_c": ("TaskC", "task_c.py"),
+    "task_d": ("TaskD", "task_d.py"),
+    "task_e": ("TaskE", "task_e.py"),
+    "anomaly": ("TaskE", "anomaly.py"),
+    "task_f": ("TaskF", "task_f.py"),
+    "energy_store": ("TaskF", "energy_store.py"),
+    "fleet_report": ("TaskF", "fleet_report.py"),
+    "rolling": ("TaskF", "rolling.py"),
+    "validation": ("TaskF", "validation.py"),
+    "columnar": ("TaskF", "columnar.py"),
+    "tariff": ("TaskF", "tariff.py"),
+    "merge_sources": ("TaskF", "merge_sources.py"),
+    "resample": ("TaskF", "resample.py"),
+    "peaks": ("TaskF", "peaks.py"),
+    "task_g_class": ("TaskG", "task_g_class.py"),
+    "task_g_dict": ("TaskG", "task_g_dict.py"),
+    "cube": ("TaskG", "cube.py"),
+    "availability": ("TaskG", "availability.py"),
+}
+
+
+def script_of(name: str) -> tuple | None:
+    """(folder, script) of a report name or of a FOLDER/SCRIPT.py path below the root."""
+    if name in REPORTS:
+        return REPORTS[name]
+    path = os.path.normpath(os.path.join(ROOT, name))
+    if name.endswith(".py") and os.path.isfile(path) and path.startswith(ROOT + os.sep):
+        return os.path.relpath(os.path.dirname(path), ROOT), os.path.basename(path)
+    return None
+
+
+def run(folder: str, script: str, args: list) -> None:
+    directory = os.path.join(ROOT, folder)
+    os.chdir(directory)
+    sys.path[0] = directory
+    sys.argv = [script, *args]
+    import runpy
+    # absolute, so spawned worker processes find the script too
+    runpy.run_path(os.path.join(directory, script), run_name="__main__")
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if not args or args[0] in ("-h", "--help", "--list"):
+        print("Usage: python -m taskcore REPORT|FOLDER/SCRIPT.py [args]\n\nReports:")
+        for name, (folder, script) in REPORTS.items():
+            print(f"  {name:<14}{folder}/{script}")
+        return
+    target = script_of(args[0])
+    if target is None:
+        sys.exit(f"Unknown report: {args[0]} (see python -m taskcore --list)")
+    run(*target, args[1:])
+
+
+if __name__ == "__main__":
+    main()
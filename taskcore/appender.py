@@ -0,0 +1,193 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Concurrency-safe appends to reservations.txt with group commit.
+
+BatchAppender queues reservations and a background thread writes them
+in batches: one write() and one fsync() per batch, done under an
+exclusive fcntl lock.  Many booking frontends (threads or processes)
+can therefore append to the same file.  read_lines() takes a shared lock,
+so a reader sees only whole batches and never a half-written line.
+
+The file keeps its style of having no newline after the last line: a
+batch starts with the newline that ends the previous line.
+
+fcntl is POSIX only; without it (Windows) the locks are skipped and
+only the single write per batch remains.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable
+
+try:
+    import fcntl
+except ImportError:  # optional (not on Windows)
+    fcntl = None
+
+BATCH_SIZE = 64
+FLUSH_INTERVAL = 0.05  # seconds a partial batch may wait
+FIELD_COUNT = 11
+
+
+def _lock(fd: int, exclusive: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _unlock(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def format_reservation(record: str | Iterable) -> str:
+    """One reservation line from a line or its 11 fields ('|' separated, no newline)."""
+    if isinstance(record, str):
+        line = record.rstrip("\n")
+        fields = line.split("|")
+    else:
+        fields = [str(x) for x in record]
+        line = "|".join(fields)
+    if len(fields) != FIELD_COUNT or "\n" in line or any("|" in f for f in fields):
+        raise ValueError(f"not a reservation line: {line!r}")
+    return line
+
+
+def write_batch(fd: int, lines: list[str]) -> None:
+    """Appends lines to an O_APPEND file: one write and one fsync under an exclusive lock."""
+    _lock(fd, True)
+    try:
+        size = os.fstat(fd).st_size
+        starts_line = size == 0 or os.pread(fd, 1, size - 1) == b"\n"
+        data = (("" if starts_line else "\n") + "\n".join(lines)).encode("utf-8")
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        _unlock(fd)
+
+
+def read_lines(path: str) -> list[str]:
+    """All lines of the file, read under a shared lock (only whole batches)."""
+    with open(path, "r", encoding="utf-8") as f:
+        _lock(f.fileno(), False)
+        try:
+            return f.readlines()
+        finally:
+            _unlock(f.fileno())
+
+
+class BatchAppender:
+    """
+    Queues reservation lines; a background thread group-commits them.
+
+    append() returns a sequence number; wait(seq) blocks until that
+    reservation is on disk, flush() until everything queued is.  If the
+    write of a batch fails (for any exception), the batch is given up and
+    its exception is raised by wait() for its reservations and by the
+    next flush() or close(); later batches are still written.
+    """
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE, interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.interval = interval
+        self.batches = 0
+        self._fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._pending: list[str] = []
+        self._queued = 0
+        self._written = 0  # reservations whose batch is done (written or failed)
+        self._flushed = 0  # reservations covered by the last flush()
+        self._flush_now = False
+        self._closed = False
+        # (first seq, last seq, exception) of every failed batch
+        self._failed: list[tuple[int, int, BaseException]] = []
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="reservation-appender", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> BatchAppender:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, record: str | Iterable) -> int:
+        line = format_reservation(record)
+        with self._cond:
+            if self._closed:
+                raise ValueError("appender is closed")
+            self._pending.append(line)
+            self._queued += 1
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+            return self._queued
+
+    def wait(self, seq: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._written >= seq)
+            self._raise_failed(seq, seq)
+
+    def flush(self) -> None:
+        with self._cond:
+            seq = self._queued
+            self._flush_now = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._written >= seq)
+            self._raise_since_flush(seq)
+
+    def _raise_failed(self, first: int, last: int) -> None:
+        """Raises the exception of the first failed batch overlapping first..last."""
+        for start, end, error in self._failed:
+            if start <= last and end >= first:
+                raise error
+
+    def _raise_since_flush(self, seq: int) -> None:
+        first, self._flushed = self._flushed + 1, max(self._flushed, seq)
+        self._raise_failed(first, seq)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        os.close(self._fd)
+        with self._cond:
+            self._raise_since_flush(self._queued)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._pending) >= self.batch_size or self._flush_now or self._closed,
+                    timeout=self.interval,
+                )
+                batch, self._pending = self._pending, []
+                self._flush_now = False
+                done = self._closed
+            if batch:
+                error = None
+                try:
+                    write_batch(self._fd, batch)
+                except BaseException as e:  # the waiting callers must not block forever
+                    error = e
+                with self._cond:
+                    if error is None:
+                        self.batches += 1
+                    else:
+                        self._failed.append((self._written + 1, self._written + len(batch), error))
+                    self._written += len(batch)
+                    self._cond.notify_all()
+            if done:
+                return
@@ -0,0 +1,112 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+External merge sort for time-stamped CSV lines that do not fit in memory.
+
+The (key, line) records of all sources are cut into runs of run_size
+records. Each run is sorted in memory and written to a temp file, and
+heapq.merge then streams the runs back in key order. Only one run plus
+one record per run file is in memory at a time.
+
+A key is a string that sorts in time order. Records with the same key
+(the same hour exported by two gateways) are merged while streaming: the
+first one wins, and earlier sources take precedence.
+
+Naive local timestamps repeat one hour when DST ends. keyed_lines(...,
+fold=True) appends the repeat count within a source to the key, so the
+repeated hour stays apart from the first one, while the same hour from
+another source is still merged.
+"""
+
+import heapq
+import os
+import tempfile
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+RUN_SIZE = 100_000
+Record = Tuple[str, str]  # (sort key, line)
+
+
+def keyed_lines(path: str, key_of: Callable[[str], str], fold: bool = False) -> Iterator[Record]:
+    """(key, line) of every data line of a CSV (header and blank lines skipped)."""
+    previous = None
+    repeat = 0
+    with open(path, "r", encoding="utf-8") as f:
+        next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            key = key_of(line)
+            if fold:
+                repeat = repeat + 1 if key == previous else 0
+                previous = key
+                key = f"{key}#{repeat}"
+            yield key, line
+
+
+def write_run(records: List[Record], directory: str) -> str:
+    records.sort(key=itemgetter(0))
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.writelines(f"{key}\t{line}\n" for key, line in records)
+    return path
+
+
+def read_run(path: str) -> Iterator[Record]:
+    with open(path, "r", encoding="utf-8") as f:
+        for text in f:
+            key, _, line = text.rstrip("\n").partition("\t")
+            yield key, line
+
+
+def sorted_runs(records: Iterable[Record], directory: str, run_size: int = RUN_SIZE) -> List[str]:
+    """Writes the records as sorted run files; returns their paths in input order."""
+    paths = []
+    run: List[Record] = []
+    for record in records:
+        run.append(record)
+        if len(run) >= run_size:
+            paths.append(write_run(run, directory))
+            run = []
+    if run:
+        paths.append(write_run(run, directory))
+    return paths
+
+
+def merge_runs(paths: List[str], dedupe: bool = True,
+               stats: Optional[Dict[str, int]] = None) -> Iterator[Record]:
+    """k-way merge of sorted runs; with dedupe only the first record of each key is kept."""
+    previous = None
+    for key, line in heapq.merge(*(read_run(p) for p in paths), key=itemgetter(0)):
+        if dedupe and key == previous:
+            if stats is not None:
+                stats["duplicates"] = stats.get("duplicates", 0) + 1
+            continue
+        previous = key
+        if stats is not None:
+            stats["rows"] = stats.get("rows", 0) + 1
+        yield key, line
+
+
+def external_sort(sources: Iterable[Iterable[Record]], run_size: int = RUN_SIZE, dedupe: bool = True,
+                  stats: Optional[Dict[str, int]] = None, tmpdir: Optional[str] = None) -> Iterator[str]:
+    """
+    Time-ordered lines of all sources. The run files live in a temporary
+    directory that is removed when the stream is exhausted or closed.
+    stats, if given, receives the counts of runs, rows and duplicates.
+    """
+    with tempfile.TemporaryDirectory(prefix="extsort-", dir=tmpdir) as directory:
+        records = (record for source in sources for record in source)
+        paths = sorted_runs(records, directory, run_size)
+        if stats is not None:
+            stats["runs"] = len(paths)
+        for _, line in merge_runs(paths, dedupe, stats):
+            yield line
@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Parser for the hourly per-phase week CSVs:
+
+  Time;Consumption phase 1 Wh;...;Production phase 3 Wh
+  2025-10-13T00:00:00;1200;800;650;0;0;0
+
+Each row becomes [datetime, c1, c2, c3, p1, p2, p3] (Wh as int).
+merged_rows() streams several unordered or overlapping files in time
+order through the external sort.
+"""
+
+from datetime import datetime
+
+_fromisoformat = datetime.fromisoformat
+
+
+def convert_data(line: list) -> list:
+    """Convert one split CSV row (7 columns) into [timestamp, six Wh values]."""
+    return [
+        _fromisoformat(line[0]),
+        int(line[1]),
+        int(line[2]),
+        int(line[3]),
+        int(line[4]),
+        int(line[5]),
+        int(line[6]),
+    ]
+
+
+def read_data(filename: str) -> list:
+    """Read a week CSV (header skipped) and return the converted rows."""
+    with open(filename, "r", encoding="utf-8") as f:
+        next(f)
+        return [convert_data(line.strip().split(";")) for line in f]
+
+
+def timestamp_key(line: str) -> str:
+    """Sort key of a data line: its naive ISO timestamp, which sorts as text."""
+    return line[:line.index(";")]
+
+
+def merged_rows(filenames: list, run_size: int = 100_000, stats: dict = None):
+    """
+    Converted rows of all files in time order, each hour once (the first
+    file wins). The repeated hour at the end of DST is kept.
+    """
+    from taskcore.extsort import external_sort, keyed_lines
+
+    sources = (keyed_lines(name, timestamp_key, fold=True) for name in filenames)
+    for line in external_sort(sources, run_size, stats=stats):
+        yield convert_data(line.split(";"))
@@ -0,0 +1,72 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Receipts of the TaskA/TaskB reservation lines (10 fields separated by '|').
+
+Every line is split once and decoded into a Reservation record;
+receipt_fields() gives the values a receipt template needs, so TaskA and
+TaskB only differ in their template (labels).  render_receipts() renders
+all lines of a file into one string for a single write.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from collections.abc import Callable, Iterable
+from datetime import date, time
+
+Reservation = namedtuple(
+    "Reservation", ["reservation_id", "booker", "day", "start", "hours", "rate", "paid", "venue", "phone", "email"]
+)
+
+
+def decode_reservation(line: str) -> Reservation:
+    """Typed record of one reservation line."""
+    f = line.rstrip("\n").split("|")
+    return Reservation(
+        int(f[0]),
+        f[1],
+        date.fromisoformat(f[2]),
+        time.fromisoformat(f[3]),
+        int(f[4]),
+        float(f[5]),
+        f[6] == "True",
+        f[7],
+        f[8],
+        f[9],
+    )
+
+
+def euros(value: float) -> str:
+    return f"{value:.2f}".replace(".", ",")
+
+
+def receipt_fields(r: Reservation) -> tuple:
+    """
+    Template values: number, booker, day, month, year, hour, minute, hours,
+    rate, total, paid (Yes/No), venue, phone, email.
+    """
+    return (
+        r.reservation_id,
+        r.booker,
+        r.day.day, r.day.month, r.day.year,
+        r.start.hour, r.start.minute,
+        r.hours,
+        euros(r.rate),
+        euros(r.hours * r.rate),
+        "Yes" if r.paid else "No",
+        r.venue,
+        r.phone,
+        r.email,
+    )
+
+
+def render_receipts(lines: Iterable[str], render: Callable[[str], str]) -> str:
+    """render(line) of all non-empty lines (stripped), separated by a blank line."""
+    return "\n".join([render(line.strip()) for line in lines if line.strip()])
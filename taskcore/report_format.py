@@ -0,0 +1,44 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Report layouts of the reservation programs (TaskC, TaskG).
+
+Line layouts are precompiled once and every distinct date / time value is
+formatted only once; sections are printed with a single print call.
+Output bytes are identical to the original per-line strftime + print.
+The status line of TaskC uses an ASCII arrow, TaskG's a '→'.
+"""
+
+from __future__ import annotations
+
+from datetime import date, time
+from functools import lru_cache
+
+CONFIRMED_LINE = "- {}, {}, {} at {}".format
+LONG_LINE = "- {}, {} at {}, duration {} h, {}".format
+STATUS_LINE = "{} → {}".format
+ASCII_STATUS_LINE = "{} -> {}".format
+
+
+@lru_cache(maxsize=None)
+def format_date(value: date) -> str:
+    """dd.mm.yyyy, formatted once per distinct date"""
+    return value.strftime("%d.%m.%Y")
+
+
+@lru_cache(maxsize=None)
+def format_time(value: time) -> str:
+    """hh.mm, formatted once per distinct time"""
+    return value.strftime("%H.%M")
+
+
+def print_section(lines: list[str]) -> None:
+    """Print all lines of a report section with one print call"""
+    if lines:
+        print("\n".join(lines))
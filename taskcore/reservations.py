@@ -0,0 +1,39 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Field parsers for reservations.txt (fields separated by '|').
+
+The ISO dates and times of the file are parsed with the C-level
+fromisoformat() instead of strptime(), which also keeps the _strptime
+module (and its regex and locale imports) out of start-up.
+"""
+
+from datetime import date, datetime, time
+
+TRUE_VALUES = ("1", "true", "yes", "y", "t")
+
+
+def parse_bool(value: str) -> bool:
+    v = value.strip()
+    return v == "True" or v.lower() in TRUE_VALUES
+
+
+def parse_date(value: str) -> date:
+    """YYYY-MM-DD"""
+    return date.fromisoformat(value.strip())
+
+
+def parse_time(value: str) -> time:
+    """HH:MM or HH:MM:SS"""
+    return time.fromisoformat(value.strip())
+
+
+def parse_datetime(value: str) -> datetime:
+    """YYYY-MM-DD HH:MM:SS"""
+    return datetime.fromisoformat(value.strip())
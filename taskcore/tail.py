@@ -0,0 +1,66 @@
+# Copyright (c) 2026 Prabesh Shrestha
+#
+# This code is licensed under the MIT License.
+# You are free to use, modify, and distribute this code,
+# provided that the original copyright notice is retained.
+#
+# See LICENSE file in the project root for full license information.
+
+"""
+Helpers of the live (--watch) modes: reading only what was appended to a
+CSV since the last poll, and replacing a report file atomically.
+"""
+
+import os
+from typing import List, Tuple
+
+
+class AppendReader:
+    """Returns the complete lines appended to a file since the last poll."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self.partial = b""
+        self.header = ""
+        self.inode = None
+
+    def poll(self) -> Tuple[List[str], bool]:
+        """
+        Returns (new lines, reset). reset is True when the file was
+        replaced or truncated and is being read again from the start.
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return [], False
+        reset = False
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            reset = self.inode is not None
+            self.inode = st.st_ino
+            self.offset = 0
+            self.partial = b""
+        if st.st_size == self.offset:
+            return [], reset
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(st.st_size - self.offset)
+        start = self.offset
+        self.offset += len(chunk)
+
+        lines = (self.partial + chunk).split(b"\n")
+        self.partial = lines.pop()  # incomplete last line waits for the next poll
+        if start == 0 and lines:
+            self.header = lines.pop(0).decode("utf-8")
+        return [line.decode("utf-8").strip() for line in lines if line.strip()], reset
+
+
+def write_atomic(path: str, text: str) -> None:
+    """Replace path with text so that readers see either the old or the new file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)